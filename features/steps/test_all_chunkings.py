@@ -0,0 +1,52 @@
+import json
+import re
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+FEATURE_FILE = Path(__file__).resolve().parent.parent / 'streaming_parser.feature'
+
+_SCENARIO = re.compile(r"^\s*Scenario: (?P<name>.+)$")
+_CONSUME = re.compile(r"^\s*(?:When|And) I consume the chunk '(?P<chunk>.*)'$")
+_CONSUME_MANY = re.compile(r"^\s*(?:When|And) I consume the chunks (?P<chunks_json>.+)$")
+_RESET = re.compile(r"^\s*(?:When|And) I reset the parser$")
+
+def _load_payloads(path):
+    """Return ``(scenario name, joined payload)`` for every scenario that consumes input.
+
+    Only the chunks consumed after a scenario's last reset make up its payload.
+    """
+    payloads, name, chunks = [], None, []
+    for line in path.read_text(encoding='utf-8').splitlines() + ['Scenario: <end>']:
+        if match := _SCENARIO.match(line):
+            if name is not None and chunks:
+                payloads.append((name, ''.join(chunks)))
+            name, chunks = match['name'], []
+        elif match := _CONSUME.match(line):
+            chunks.append(match['chunk'])
+        elif match := _CONSUME_MANY.match(line):
+            chunks.extend(json.loads(match['chunks_json']))
+        elif _RESET.match(line):
+            chunks = []
+    return payloads
+
+PAYLOADS = _load_payloads(FEATURE_FILE)
+
+def _consume_all(parser_cls, chunks):
+    parser = parser_cls()
+    for chunk in chunks:
+        parser.consume_bytes(chunk)
+    return parser.get()
+
+@pytest.mark.parametrize('payload', [p for _, p in PAYLOADS], ids=[n for n, _ in PAYLOADS])
+def test_every_two_way_chunking_matches_single_shot(parser_cls, payload):
+    """Splitting a scenario's payload at any byte must not change the parsed result."""
+    data = payload.encode('utf-8')
+    reference = _consume_all(parser_cls, [data])
+    chunkings = [(data[:i], data[i:]) for i in range(1, len(data))]
+    # Parsers are stateful, so each chunking gets its own instance.
+    with ThreadPoolExecutor() as pool:
+        results = list(pool.map(lambda chunks: _consume_all(parser_cls, chunks), chunkings))
+    mismatches = [chunks for chunks, result in zip(chunkings, results) if result != reference]
+    assert not mismatches, f"{len(mismatches)} chunkings differ from {reference!r}, e.g. {mismatches[0]!r}"
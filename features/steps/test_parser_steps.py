@@ -1,32 +1,75 @@
+import sys
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict
+
 from pytest_bdd import scenarios, given, when, then, parsers
-import json
-from src.serializers.solid.ultrajson_parser import StreamingJsonParser
+
+# Expected results are decoded with the stdlib, which keeps integers exact, so
+# the oracle never shares a lossy decoder with the parsers under test.
+from json import loads as json_loads
+
+if TYPE_CHECKING:
+    from src.serializers.solid.ultrajson_parser import StreamingJsonParser
 
 scenarios('../streaming_parser.feature')
 
+@lru_cache(maxsize=1024)
+def _parse_expected(expected_result: str) -> Dict[str, Any]:
+    """Parse an expected-result literal once; callers must not mutate it.
+
+    Top-level keys are interned, as the parser interns the keys it emits, so
+    dict comparisons can match keys by identity.
+    """
+    expected = json_loads(expected_result)
+    return {sys.intern(key): value for key, value in expected.items()}
+
+# Expected-result literals are converted while the step text is matched, so
+# then-steps receive the parsed object.
+_EXPECTED_TYPES = {'json': _parse_expected}
+
+# Step matchers are built once at import and shared by every scenario.
+_P_CONSUME = parsers.parse("I consume the chunk '{chunk}'")
+_P_CONSUME_MANY = parsers.parse('I consume the chunks {chunks_json}')
+_P_RESULT = parsers.parse('the result should be {expected_result:json}', extra_types=_EXPECTED_TYPES)
+_P_CONTAINS = parsers.parse('the result should contain {expected_result:json}', extra_types=_EXPECTED_TYPES)
+_P_IF_KEY = parsers.parse('if "{key}" is in the result, it should be {value:d}')
+_P_RESET = parsers.parse('I reset the parser')
+
+_MISSING = object()
+
 @given('a StreamingJsonParser instance', target_fixture='parser')
-def parser():
-    return StreamingJsonParser()
+def parser(session_parser: 'StreamingJsonParser') -> 'StreamingJsonParser':
+    session_parser.reset()
+    return session_parser
+
+@when(_P_CONSUME)
+def consume_chunk(parser: 'StreamingJsonParser', chunk: str) -> None:
+    parser.consume_bytes(chunk.encode('utf-8'))
 
-@when(parsers.parse("I consume the chunk '{chunk}'"))
-def consume_chunk(parser, chunk):
-    parser.consume(chunk)
+@when(_P_CONSUME_MANY)
+def consume_chunks(parser: 'StreamingJsonParser', chunks_json: str) -> None:
+    for chunk in json_loads(chunks_json):
+        parser.consume_bytes(chunk.encode('utf-8'))
 
-@then(parsers.parse('the result should be {expected_result}'))
-def result_should_be(parser, expected_result):
-    expected = json.loads(expected_result)
-    assert parser.get() == expected
+@when(_P_RESET)
+def reset_parser(parser: 'StreamingJsonParser') -> None:
+    parser.reset()
 
-@then(parsers.parse('the result should contain {expected_result}'))
-def result_should_contain(parser, expected_result):
-    expected = json.loads(expected_result)
+@then(_P_RESULT)
+def result_should_be(parser: 'StreamingJsonParser', expected_result: Dict[str, Any]) -> None:
+    assert parser.get() == expected_result
+
+@then(_P_CONTAINS)
+def result_should_contain(parser: 'StreamingJsonParser', expected_result: Dict[str, Any]) -> None:
     actual = parser.get()
-    for key, value in expected.items():
-        assert key in actual
-        assert actual[key] == value
+    if len(expected_result) == 1:
+        (key, value), = expected_result.items()
+        assert actual.get(key, _MISSING) == value, f"{key!r}: {actual.get(key)!r} != {value!r}"
+        return
+    assert {key: actual.get(key, _MISSING) for key in expected_result} == expected_result
 
-@then(parsers.parse('if "{key}" is in the result, it should be {value:d}'))
-def if_key_in_result(parser, key, value):
+@then(_P_IF_KEY)
+def if_key_in_result(parser: 'StreamingJsonParser', key: str, value: int) -> None:
     actual = parser.get()
     if key in actual:
         assert actual[key] == value
@@ -14,11 +14,40 @@ Feature: Streaming JSON Parser
     And I consume the chunk '"bar"}'
     Then the result should be {"foo": "bar"}
 
+  Scenario: Parse a JSON object streamed in many chunks
+    Given a StreamingJsonParser instance
+    When I consume the chunks ["{\"fo", "o\": \"b", "ar\", \"n", "um\": 4", "2, \"ok\": tr", "ue}"]
+    Then the result should be {"foo": "bar", "num": 42, "ok": true}
+
+  @unfused
+  Scenario: Parse a JSON object fed one fragment per step
+    Given a StreamingJsonParser instance
+    When I consume the chunk '{"a'
+    And I consume the chunk '": "x'
+    And I consume the chunk 'y", "b'
+    And I consume the chunk '": nul'
+    And I consume the chunk 'l}'
+    Then the result should be {"a": "xy", "b": null}
+
+  Scenario: Parse a JSON object fed one fragment per step after fusing the steps
+    Given a StreamingJsonParser instance
+    When I consume the chunk '{"a'
+    And I consume the chunk '": "x'
+    And I consume the chunk 'y", "b'
+    And I consume the chunk '": nul'
+    And I consume the chunk 'l}'
+    Then the result should be {"a": "xy", "b": null}
+
   Scenario: Parse a partial string value
     Given a StreamingJsonParser instance
     When I consume the chunk '{"hello": "worl'
     Then the result should be {"hello": "worl"}
 
+  Scenario: Parse string values with escape sequences
+    Given a StreamingJsonParser instance
+    When I consume the chunk '{"say \"hi\"": "line\nbreak \\ end", "path": "a\/b"}'
+    Then the result should be {"say \"hi\"": "line\nbreak \\ end", "path": "a/b"}
+
   Scenario: Do not return partial keys
     Given a StreamingJsonParser instance
     When I consume the chunk '{"par'
@@ -30,6 +59,11 @@ Feature: Streaming JSON Parser
     Then the result should contain {"a": "1"}
     And if "b" is in the result, it should be 2
 
+  Scenario: Parse an integer wider than 64 bits
+    Given a StreamingJsonParser instance
+    When I consume the chunk '{"big": 18446744073709551617}'
+    Then the result should be {"big": 18446744073709551617}
+
   Scenario: Parse boolean and null values
     Given a StreamingJsonParser instance
     When I consume the chunk '{"t": true, "f": false, "n": null'
@@ -44,3 +78,12 @@ Feature: Streaming JSON Parser
     Given a StreamingJsonParser instance
     When I consume the chunk '{"outer": {"inner": "val'
     Then the result should contain {"outer": {"inner": "val"}}
+
+  Scenario: Reuse the parser for documents with repeated keys
+    Given a StreamingJsonParser instance
+    When I consume the chunk '{"id": 1, "name": "a"}'
+    And I reset the parser
+    And I consume the chunk '{"id": 2, "name": "b"}'
+    And I reset the parser
+    And I consume the chunks ["{\"id\": 3, \"nam\": \"c\", \"na", "me\": \"d\"}"]
+    Then the result should be {"id": 3, "nam": "c", "name": "d"}
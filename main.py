@@ -9,25 +9,44 @@ metrics including performance, throughput, CPU usage, and network simulation.
 import os
 import sys
 from pathlib import Path
-from typing import Dict, Optional, Type
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Type
+
+PROJECT_ROOT = Path(__file__).resolve().parent
+SRC_ROOT = PROJECT_ROOT / "src"
 
 # Ensure `src/` is in sys.path so imports like `serializers.json_parser` work
-sys.path.insert(0, str(Path(__file__).parent / "src"))
+sys.path.insert(0, str(SRC_ROOT))
 
 import argparse
+import csv
+import functools
+import heapq
 import importlib
 import json
 import multiprocessing
+import operator
+import pickle
+import statistics
 import time
 import traceback
-import tracemalloc
+from collections import defaultdict
 from concurrent.futures import ProcessPoolExecutor, as_completed
-from typing import List, Any, Tuple
-from dataclasses import dataclass
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing.shared_memory import SharedMemory
+from dataclasses import dataclass, fields
 
-import psutil
 from tqdm import tqdm
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+try:
+    import resource
+except ImportError:  # Windows has no resource module; fall back to psutil
+    resource = None
+
 from simulation.algo_metadata import ALGORITHM_METADATA
 from simulation.data_gen import generate_test_data, create_streaming_chunks
 from simulation.net_sim import HTTPSimulator, TCPSimulator, TelnetSimulator
@@ -38,7 +57,11 @@ from simulation.utils import (
     save_results,
 )
 
+# dataclass(slots=True) needs Python 3.10; older interpreters get plain dataclasses.
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
+@functools.lru_cache(maxsize=32)
 def sanitize_output_path(
     base_path: str, user_path: str, subdir_allowed: bool = True
 ) -> str:
@@ -72,21 +95,11 @@ def sanitize_output_path(
 
     # Check if the resolved path is within the allowed base path
     if subdir_allowed:
-        # Allow subdirectories - check if base_path is a prefix of real_target_path
-        try:
-            os.path.relpath(real_target_path, base_path)
-            # If relpath doesn't raise ValueError, the path is within base_path
-            if (
-                not real_target_path.startswith(base_path + os.sep)
-                and real_target_path != base_path
-            ):
-                raise ValueError(
-                    f"Target path is outside allowed base directory: {real_target_path}"
-                )
-        except ValueError as e:
+        # Allow subdirectories - compare path components, not string prefixes
+        if os.path.commonpath([real_target_path, base_path]) != base_path:
             raise ValueError(
                 f"Target path is outside allowed base directory: {real_target_path}"
-            ) from e
+            )
     else:
         # Only allow files directly in base_path
         if os.path.dirname(real_target_path) != base_path:
@@ -97,6 +110,27 @@ def sanitize_output_path(
     return real_target_path
 
 
+def _json_dumps_bytes(obj: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON, using orjson when it is installed.
+
+    orjson rejects integers wider than 64 bits and non-str dict keys, so
+    such payloads fall back to the standard library encoder.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=str)
+        except TypeError:
+            pass
+    return json.dumps(
+        obj, separators=(",", ":"), ensure_ascii=False, default=str
+    ).encode("utf-8")
+
+
+# Bump whenever generate_test_data or create_streaming_chunks change their output,
+# so stale on-disk datasets are not reused.
+DATASET_CACHE_VERSION = 3
+
+
 @dataclass
 class BenchmarkConfig:
     """Configuration for benchmark execution."""
@@ -105,6 +139,10 @@ class BenchmarkConfig:
     runs_per_test: int = 3
     protocols: Optional[List[str]] = None
     dataset_sizes: Optional[List[int]] = None
+    cache_datasets: bool = True
+    deep_memory_profile: bool = False
+    output_format: str = "both"
+    parallel_parsers: bool = False
 
     def __post_init__(self):
         if self.protocols is None:
@@ -113,20 +151,21 @@ class BenchmarkConfig:
             self.dataset_sizes = [100, 1000, 2000]
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class TestDataset:
     """Container for test dataset information."""
 
     size: int
-    data: Dict[str, Any]
     json_str: str
     json_bytes: bytes
     size_chars: int
     size_bytes: int
     chunks: List[bytes]
+    # Cumulative byte offsets of each chunk within b"".join(chunks)
+    chunk_offsets: List[int]
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class BenchmarkMetrics:
     """Container for benchmark metrics."""
 
@@ -142,9 +181,12 @@ class BenchmarkMetrics:
     total_ser_deser_time_ms: float = 0.0
     total_with_conversions_ms: float = 0.0
     throughput_mbps: float = 0.0
+    batch_consume_time_ms: float = 0.0
     cpu_time_seconds: float = 0.0
     memory_current_bytes: int = 0
     memory_peak_bytes: int = 0
+    # True when the memory figures come from tracemalloc (--deep-memory-profile)
+    memory_traced: bool = False
     synchronization_overhead_ms: float = 0.0
     network_latency_ms: float = 0.0
     speedup: Optional[float] = None
@@ -154,6 +196,29 @@ class BenchmarkMetrics:
     time_complexity: str = "Unknown"
     space_complexity: str = "Unknown"
     overall_complexity: str = "Unknown"
+    partial_serialization_chars: int = 0
+    partial_serialization_bytes: int = 0
+    partial_deserialization_chars: int = 0
+    partial_deserialization_bytes: int = 0
+
+
+class ParallelResult(NamedTuple):
+    """Outcome of one parallel speedup run."""
+
+    parallel_time_ms: float
+    num_workers: int
+    memory_usage_mb: float = 0.0
+    success: bool = False
+    error: Optional[str] = None
+
+    @classmethod
+    def failure(cls, error: str) -> "ParallelResult":
+        return cls(parallel_time_ms=0, num_workers=0, error=error)
+
+
+# Discovered parser classes keyed by the mtimes of the scanned package
+# directories; adding or removing a parser module changes the key.
+_PARSER_CACHE: Dict[Tuple[int, ...], Dict[str, Type]] = {}
 
 
 class ParserDiscovery:
@@ -161,6 +226,12 @@ class ParserDiscovery:
     SUBMODULES = ["raw", "solid", "anyio"]
 
     def discover_parsers(self) -> Dict[str, Type]:
+        cache_key = self._cache_key()
+        cached = _PARSER_CACHE.get(cache_key)
+        if cached is not None:
+            print(f"\nLoaded {len(cached)} parsers (cached)")
+            return dict(cached)
+
         parsers: Dict[str, Type] = {}
         failed_parsers = []
 
@@ -182,11 +253,21 @@ class ParserDiscovery:
             )
 
         print(f"\nLoaded {len(parsers)} parsers successfully")
+        _PARSER_CACHE[cache_key] = dict(parsers)
         return parsers
 
+    def _root(self) -> Path:
+        return SRC_ROOT / self.BASE_PACKAGE
+
+    def _cache_key(self) -> Tuple[int, ...]:
+        root = self._root()
+        return tuple(
+            (root / sub).stat().st_mtime_ns if (root / sub).is_dir() else 0
+            for sub in self.SUBMODULES
+        )
+
     def _iter_module_paths(self):
-        # 🔽 Update this line
-        root = Path(__file__).parent / "src" / self.BASE_PACKAGE
+        root = self._root()
         for sub in self.SUBMODULES:
             pkg_dir = root / sub
             if not pkg_dir.is_dir():
@@ -217,13 +298,16 @@ class ParserDiscovery:
 class TestDatasetGenerator:
     """Generates test datasets for benchmarking."""
 
+    def __init__(self, cache_dir: Optional[Path] = None):
+        self._cache_dir = cache_dir
+
     def generate_datasets(self, sizes: List[int]) -> Dict[int, TestDataset]:
         """Generate test datasets of different sizes."""
         datasets = {}
 
         print("\nGenerating test datasets...")
         for size in tqdm(sizes, desc="Dataset sizes"):
-            dataset = self._create_dataset(size)
+            dataset = self._load_or_create_dataset(size)
             datasets[size] = dataset
             tqdm.write(
                 f"  Size {size}: {dataset.size_chars:,} chars, {dataset.size_bytes:,} bytes"
@@ -231,22 +315,49 @@ class TestDatasetGenerator:
 
         return datasets
 
+    def _load_or_create_dataset(self, size: int) -> TestDataset:
+        """Load a dataset from the on-disk cache, generating and caching it on a miss."""
+        if self._cache_dir is None:
+            return self._create_dataset(size)
+
+        cache_file = self._cache_dir / f"ds_v{DATASET_CACHE_VERSION}_{size}.pkl"
+        if cache_file.is_file():
+            try:
+                with cache_file.open("rb") as fh:
+                    dataset = pickle.load(fh)
+                if isinstance(dataset, TestDataset) and dataset.size == size:
+                    return dataset
+            except (OSError, EOFError, AttributeError, TypeError, pickle.UnpicklingError):
+                pass  # Corrupt or incompatible cache entry; regenerate below
+
+        dataset = self._create_dataset(size)
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            with cache_file.open("wb") as fh:
+                pickle.dump(dataset, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError as e:
+            tqdm.write(f"  ⚠️  Could not cache dataset {size}: {e}")
+        return dataset
+
     @staticmethod
     def _create_dataset(size: int) -> TestDataset:
         """Create a single test dataset."""
         data = generate_test_data(size)
-        json_str = json.dumps(data, separators=(",", ":"))
-        json_bytes = json_str.encode("utf-8")
+        json_bytes = _json_dumps_bytes(data)
+        json_str = json_bytes.decode("utf-8")
         chunks = create_streaming_chunks(json_bytes)
+        chunk_offsets = [0]
+        for chunk in chunks:
+            chunk_offsets.append(chunk_offsets[-1] + len(chunk))
 
         return TestDataset(
             size=size,
-            data=data,
             json_str=json_str,
             json_bytes=json_bytes,
             size_chars=len(json_str),
             size_bytes=len(json_bytes),
             chunks=chunks,
+            chunk_offsets=chunk_offsets,
         )
 
 
@@ -266,29 +377,102 @@ class NetworkSimulatorFactory:
 
 
 class MetricsCollector:
-    """Collects and manages benchmark metrics."""
+    """Collects and manages benchmark metrics.
+
+    By default memory is sampled from the OS, which costs a couple of
+    syscalls per run, and both figures are what the run added on top of the
+    process RSS it started with:
+
+    - ``memory_current_bytes``: RSS after the run minus RSS before it.
+    - ``memory_peak_bytes``: the highest RSS seen during the run minus RSS
+      before it. When the run pushes the process past its previous
+      high-water mark, that new mark is the exact peak; otherwise the RSS
+      sampled at the end of the run is used.
+
+    RSS moves in whole pages and freed memory is often kept by the
+    allocator, so small runs may report 0. With ``deep_memory_profile``
+    every Python allocation is traced instead; this is far more precise but
+    slows the measured parser down considerably.
+    """
 
-    def __init__(self):
-        self._process = psutil.Process()
+    _STATM_PATH = "/proc/self/statm"
+
+    def __init__(self, deep_memory_profile: bool = False):
+        import psutil  # deferred so `--help` does not pay for it
 
-    def start_collection(self) -> Tuple[Any, Any]:
-        """Start collecting metrics."""
-        tracemalloc.start()
-        return self._process.cpu_times(), time.perf_counter()
+        self._process = psutil.Process()
+        self._deep_memory_profile = deep_memory_profile
+        # On Linux, current RSS is read from statm directly (one small read)
+        self._page_size = (
+            os.sysconf("SC_PAGE_SIZE") if os.path.exists(self._STATM_PATH) else None
+        )
 
-    def stop_collection(self, cpu_start: Any) -> Tuple[float, int, int]:
+    def current_rss_bytes(self) -> int:
+        """Return the current resident set size in bytes."""
+        if self._page_size is not None:
+            with open(self._STATM_PATH, "rb") as fh:
+                return int(fh.read().split()[1]) * self._page_size
+        return self._process.memory_info().rss
+
+    @property
+    def traces_memory(self) -> bool:
+        """Whether memory figures come from tracemalloc rather than the OS."""
+        return self._deep_memory_profile
+
+    def start_collection(self) -> Tuple[Any, Tuple[int, int]]:
+        """Start collecting metrics; returns the CPU times and the RSS baselines."""
+        if self._deep_memory_profile:
+            import tracemalloc
+
+            tracemalloc.start()
+            return self._process.cpu_times(), (0, 0)
+        return self._process.cpu_times(), (self.current_rss_bytes(), self._peak_rss_bytes())
+
+    def stop_collection(
+        self, cpu_start: Any, memory_start: Tuple[int, int]
+    ) -> Tuple[float, int, int]:
         """Stop collecting metrics and return results."""
         cpu_end = self._process.cpu_times()
         cpu_time = (cpu_end.user - cpu_start.user) + (cpu_end.system - cpu_start.system)
 
-        current, peak = tracemalloc.get_traced_memory()
-        tracemalloc.stop()
+        if self._deep_memory_profile:
+            import tracemalloc
+
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        else:
+            rss_start, high_water_start = memory_start
+            rss_end = self.current_rss_bytes()
+            high_water_end = self._peak_rss_bytes()
+            # A raised high-water mark was set during this run, so it is the run's peak
+            peak_rss = high_water_end if high_water_end > high_water_start else rss_end
+            current = max(0, rss_end - rss_start)
+            peak = max(current, peak_rss - rss_start)
 
         return cpu_time, current, peak
 
+    def _peak_rss_bytes(self) -> int:
+        """Return the process high-water RSS in bytes."""
+        if resource is not None:
+            max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere
+            return max_rss if sys.platform == "darwin" else max_rss * 1024
+        memory_info = self._process.memory_info()
+        return getattr(memory_info, "peak_wset", memory_info.rss)
+
 
 class SingleRunBenchmark:
-    """Handles execution of a single benchmark run."""
+    """Handles execution of a single benchmark run.
+
+    Parser classes may set ``SUPPORTS_BATCH = True`` to declare that one
+    ``consume`` of the concatenated chunks is equivalent to consuming them
+    one by one. Such parsers are fed a single pre-joined buffer, so the
+    measurement is not dominated by per-chunk call overhead.
+
+    Parsers that always reproduce the full input document may set
+    ``LOSSLESS = True``; their deserialized size is then taken from the
+    dataset instead of re-encoding the result.
+    """
 
     def __init__(
         self,
@@ -333,7 +517,7 @@ class SingleRunBenchmark:
     ) -> None:
         """Execute the actual benchmark logic."""
         # Start a metrics collection
-        cpu_start, _ = self._metrics_collector.start_collection()
+        cpu_start, memory_start = self._metrics_collector.start_collection()
 
         # Initialize parser
         parser = parser_class()
@@ -345,9 +529,16 @@ class SingleRunBenchmark:
         metrics.network_latency_ms = transmission_result.total_latency
 
         # Measure serialization (parsing chunks)
-        with Timer() as serialize_timer:
-            for chunk in transmitted_chunks:
-                parser.consume(chunk)
+        if getattr(parser_class, "SUPPORTS_BATCH", False) and transmitted_chunks:
+            # Join outside the timer; slicing keeps the chunk type (str or bytes)
+            batch = transmitted_chunks[0][:0].join(transmitted_chunks)
+            with Timer() as serialize_timer:
+                parser.consume(batch)
+            metrics.batch_consume_time_ms = serialize_timer.elapsed_ms
+        else:
+            with Timer() as serialize_timer:
+                for chunk in transmitted_chunks:
+                    parser.consume(chunk)
 
         # Measure deserialization (getting final result)
         with Timer() as deserialize_timer:
@@ -355,7 +546,7 @@ class SingleRunBenchmark:
 
         # Stop a metrics collection
         cpu_time, memory_current, memory_peak = self._metrics_collector.stop_collection(
-            cpu_start
+            cpu_start, memory_start
         )
 
         # Update metrics
@@ -368,6 +559,8 @@ class SingleRunBenchmark:
             memory_peak,
             dataset,
             result,
+            getattr(parser_class, "LOSSLESS", False),
+            self._metrics_collector.traces_memory,
         )
 
     @staticmethod
@@ -380,6 +573,8 @@ class SingleRunBenchmark:
         memory_peak: int,
         dataset: TestDataset,
         result: Any,
+        lossless: bool = False,
+        memory_traced: bool = False,
     ) -> None:
         """Update metrics with collected data_gen."""
         total_time = serialize_timer.elapsed_ms + deserialize_timer.elapsed_ms
@@ -393,91 +588,156 @@ class SingleRunBenchmark:
         metrics.cpu_time_seconds = cpu_time
         metrics.memory_current_bytes = memory_current
         metrics.memory_peak_bytes = memory_peak
+        metrics.memory_traced = memory_traced
 
         # Calculate result sizes
         if result:
-            result_str = str(result)
             metrics.partial_serialization_chars = dataset.size_chars
             metrics.partial_serialization_bytes = dataset.size_bytes
-            metrics.partial_deserialization_chars = len(result_str)
-            metrics.partial_deserialization_bytes = len(result_str.encode("utf-8"))
+            if lossless:
+                metrics.partial_deserialization_chars = dataset.size_chars
+                metrics.partial_deserialization_bytes = dataset.size_bytes
+            else:
+                # Same encoding as the dataset, so sizes are directly comparable
+                result_json = _json_dumps_bytes(result)
+                metrics.partial_deserialization_chars = len(result_json.decode("utf-8"))
+                metrics.partial_deserialization_bytes = len(result_json)
+
+
+def _parser_path(parser_class: type) -> str:
+    """Return the importable dotted path of a parser class."""
+    return f"{parser_class.__module__}.{parser_class.__qualname__}"
+
+
+def _import_parser(parser_path: str) -> type:
+    """Resolve a dotted parser path; repeat calls hit ``sys.modules``."""
+    module_name, class_name = parser_path.rsplit(".", 1)
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def _add_src_to_path(src_root: str) -> None:
+    """Pool initializer: make parser modules importable in spawned workers."""
+    if src_root not in sys.path:
+        sys.path.insert(0, src_root)
 
 
 class ParallelBenchmark:
-    """Handles parallel benchmark execution for speedup calculation."""
+    """Handles parallel benchmark execution for speedup calculation.
+
+    One worker pool is kept for the whole benchmark suite so that worker
+    interpreters are started once rather than per (parser, dataset) pair.
+    Each dataset's chunks are copied once into shared memory; workers get
+    only the block name and their chunks' byte spans.
+    """
+
+    def __init__(
+        self, max_workers: int = 4, metrics_collector: Optional[MetricsCollector] = None
+    ):
+        self._metrics_collector = metrics_collector or MetricsCollector()
+        self._max_workers = max(1, min(max_workers, multiprocessing.cpu_count()))
+        self._executor = self._new_executor()
+        self._shared_chunks: Dict[int, SharedMemory] = {}
+
+    def _new_executor(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self._max_workers,
+            initializer=_add_src_to_path,
+            initargs=(str(SRC_ROOT),),
+        )
+
+    def shutdown(self) -> None:
+        """Stop the worker pool and release the shared chunk buffers."""
+        self._executor.shutdown(wait=True)
+        for shm in self._shared_chunks.values():
+            shm.close()
+            shm.unlink()
+        self._shared_chunks.clear()
+
+    def _share_chunks(self, dataset: TestDataset) -> SharedMemory:
+        """Return the shared-memory copy of the dataset's chunks, creating it once."""
+        shm = self._shared_chunks.get(dataset.size)
+        if shm is None:
+            payload = b"".join(dataset.chunks)
+            shm = SharedMemory(create=True, size=len(payload))
+            shm.buf[: len(payload)] = payload
+            self._shared_chunks[dataset.size] = shm
+        return shm
 
     def execute(
         self, parser_class: type, dataset: TestDataset, max_workers: int = 4
-    ) -> Dict[str, Any]:
+    ) -> ParallelResult:
         """Execute parallel benchmark for speedup calculation."""
         if parser_class is None:
-            return {
-                "parallel_time_ms": 0,
-                "num_workers": 0,
-                "success": False,
-                "error": "parser_class cannot be None",
-            }
+            return ParallelResult.failure("parser_class cannot be None")
 
         if not dataset.chunks:
-            return {
-                "parallel_time_ms": 0,
-                "num_workers": 0,
-                "success": False,
-                "error": "dataset.chunks is empty",
-            }
-
-        num_workers = min(max_workers, multiprocessing.cpu_count())
-        chunk_groups = [dataset.chunks[i::num_workers] for i in range(num_workers)]
+            return ParallelResult.failure("dataset.chunks is empty")
+
+        num_workers = min(max_workers, self._max_workers)
+        offsets = dataset.chunk_offsets
+        # Worker i takes chunks i, i + num_workers, ... as (start, end) spans
+        span_groups = [
+            list(zip(offsets[i:-1:num_workers], offsets[i + 1 :: num_workers]))
+            for i in range(num_workers)
+        ]
+        shm_name = self._share_chunks(dataset).name
+        parser_path = _parser_path(parser_class)
 
-        start_time = time.perf_counter()
-        start_memory = psutil.Process().memory_info().rss
+        start_ns = time.perf_counter_ns()
+        start_memory = self._metrics_collector.current_rss_bytes()
 
         try:
             timeout_seconds = 30  # Configurable timeout
-            with ProcessPoolExecutor(max_workers=num_workers) as executor:
-                futures = [
-                    executor.submit(
-                        self._process_chunk_group, parser_class, chunk_group
+            futures = [
+                self._executor.submit(
+                    self._process_chunk_group, parser_path, shm_name, spans
+                )
+                for spans in span_groups
+            ]
+
+            results = []
+            for future in as_completed(futures, timeout=timeout_seconds):
+                try:
+                    results.append(future.result(timeout=timeout_seconds))
+                except ValueError:
+                    # Log the error but continue with other workers
+                    print(
+                        f"Timeout occurred while processing chunk group: {future.exception()}"
                     )
-                    for chunk_group in chunk_groups
-                ]
-
-                results = []
-                for future in as_completed(futures, timeout=timeout_seconds):
-                    try:
-                        results.append(future.result(timeout=timeout_seconds))
-                    except ValueError:
-                        # Log the error but continue with other workers
-                        print(
-                            f"Timeout occurred while processing chunk group: {future.exception()}"
-                        )
-                        continue
-
-            parallel_time = (time.perf_counter() - start_time) * 1000  # ms
-            end_memory = psutil.Process().memory_info().rss
-
-            return {
-                "parallel_time_ms": parallel_time,
-                "num_workers": num_workers,
-                "memory_usage_mb": (end_memory - start_memory) / 1024 / 1024,
-                "success": True,
-            }
+                    continue
 
+            parallel_time = (time.perf_counter_ns() - start_ns) / 1_000_000  # ms
+            end_memory = self._metrics_collector.current_rss_bytes()
+
+            return ParallelResult(
+                parallel_time_ms=parallel_time,
+                num_workers=num_workers,
+                memory_usage_mb=(end_memory - start_memory) / 1024 / 1024,
+                success=True,
+            )
+
+        except BrokenProcessPool as e:
+            # A worker died (e.g. a crashing extension); replace the pool so
+            # later parsers still get a working one.
+            self._executor.shutdown(wait=False)
+            self._executor = self._new_executor()
+            return ParallelResult.failure(str(e))
         except Exception as e:
-            return {
-                "parallel_time_ms": 0,
-                "num_workers": 0,
-                "success": False,
-                "error": str(e),
-            }
+            return ParallelResult.failure(str(e))
 
     @staticmethod
-    def _process_chunk_group(parser_class: type, chunks: List[bytes]) -> Any:
-        """Process a group of chunks in parallel worker."""
-        parser = parser_class()
-        for chunk in chunks:
-            parser.consume(chunk)
-        return parser.get()
+    def _process_chunk_group(
+        parser_path: str, shm_name: str, spans: List[Tuple[int, int]]
+    ) -> Any:
+        """Process a group of chunks, read from shared memory, in a parallel worker."""
+        shm = SharedMemory(name=shm_name)
+        try:
+            parser = _import_parser(parser_path)()
+            for start, end in spans:
+                parser.consume(bytes(shm.buf[start:end]))
+            return parser.get()
+        finally:
+            shm.close()
 
 
 class SpeedupCalculator:
@@ -485,25 +745,49 @@ class SpeedupCalculator:
 
     @staticmethod
     def calculate_speedup(
-        sequential_times: List[float], parallel_result: Dict[str, Any]
+        sequential_times: List[float], parallel_result: ParallelResult
     ) -> Optional[Dict[str, float]]:
         """Calculate speedup metrics."""
-        if not sequential_times or not parallel_result["success"]:
+        if not sequential_times or not parallel_result.success:
             return None
 
-        avg_sequential_time = sum(sequential_times) / len(sequential_times)
+        avg_sequential_time = statistics.fmean(sequential_times)
         return calculate_amdahl_speedup(
             avg_sequential_time,
-            parallel_result["parallel_time_ms"],
-            parallel_result["num_workers"],
+            parallel_result.parallel_time_ms,
+            parallel_result.num_workers,
         )
 
 
+# Field names in declaration order, read in one call when exporting results
+_METRICS_FIELDS = tuple(f.name for f in fields(BenchmarkMetrics))
+_METRICS_GETTER = operator.attrgetter(*_METRICS_FIELDS)
+
+
 class BenchmarkResultsManager:
-    """Manages benchmark results and metadata."""
+    """Manages benchmark results and metadata.
 
-    def __init__(self):
+    When an output directory is given, each finished (parser, dataset size)
+    group is appended to the CSV / JSON-lines output as soon as its speedup
+    metrics are known, so results reach disk while the benchmark runs.
+    """
+
+    # CSV columns (sorted, as simulation.utils writes them), emitted as tuples
+    _CSV_FIELDS = tuple(sorted(_METRICS_FIELDS))
+    _CSV_GETTER = operator.attrgetter(*_CSV_FIELDS)
+
+    def __init__(self, output_dir: Optional[Path] = None, format_type: str = "both"):
         self._results = []
+        # Results per (parser_name, dataset_size), kept in step with _results
+        self._by_group: Dict[Tuple[str, int], List[BenchmarkMetrics]] = defaultdict(
+            list
+        )
+        self._output_dir = output_dir
+        self._format_type = format_type
+        self._timestamp = time.strftime("%Y%m%d_%H%M%S")
+        self._csv_file = None
+        self._csv_writer = None
+        self._jsonl_file = None
 
     def add_result(self, metrics: BenchmarkMetrics) -> None:
         """Add a benchmark result."""
@@ -515,19 +799,70 @@ class BenchmarkResultsManager:
         metrics.overall_complexity = algo_info.get("overall_complexity", "Unknown")
 
         self._results.append(metrics)
+        self._by_group[(metrics.parser_name, metrics.dataset_size)].append(metrics)
 
     def update_speedup_metrics(
         self, parser_name: str, dataset_size: int, speedup_data: Dict[str, float]
     ) -> None:
         """Update speedup metrics for matching results."""
-        for result in self._results:
-            if (
-                result.parser_name == parser_name
-                and result.dataset_size == dataset_size
-            ):
-                result.speedup = speedup_data["speedup"]
-                result.efficiency = speedup_data["efficiency"]
-                result.amdahl_theoretical_speedup = speedup_data["theoretical_speedup"]
+        for result in self._by_group.get((parser_name, dataset_size), ()):
+            result.speedup = speedup_data["speedup"]
+            result.efficiency = speedup_data["efficiency"]
+            result.amdahl_theoretical_speedup = speedup_data["theoretical_speedup"]
+
+    def flush_group(self, parser_name: str, dataset_size: int) -> None:
+        """Append a finished (parser, dataset size) group to the output files."""
+        if self._output_dir is None:
+            return
+        self._open_streams()
+        for metrics in self._by_group.get((parser_name, dataset_size), ()):
+            if self._csv_writer is not None:
+                self._csv_writer.writerow(self._CSV_GETTER(metrics))
+            if self._jsonl_file is not None:
+                row = self._metrics_to_dict(metrics)
+                self._jsonl_file.write(_json_dumps_bytes(row) + b"\n")
+        for fh in (self._csv_file, self._jsonl_file):
+            if fh is not None:
+                fh.flush()
+
+    def close(self) -> List[Path]:
+        """Finish the streamed output files and return the paths written."""
+        if self._output_dir is None:
+            return []
+        self._open_streams()
+        written = []
+        if self._csv_file is not None:
+            self._csv_file.close()
+            self._csv_file = self._csv_writer = None
+            written.append(self._output_path("csv"))
+        if self._jsonl_file is not None:
+            self._jsonl_file.close()
+            self._jsonl_file = None
+            # Rewrite the JSON lines as the regular JSON results document
+            jsonl_path = self._output_path("jsonl")
+            with jsonl_path.open("rb") as fh:
+                results = [json.loads(line) for line in fh]
+            json_path = self._output_path("json")
+            save_results(results, json_path, "json")
+            jsonl_path.unlink()
+            written.append(json_path)
+        return written
+
+    def _output_path(self, suffix: str) -> Path:
+        return self._output_dir / f"benchmark_results_{self._timestamp}.{suffix}"
+
+    def _open_streams(self) -> None:
+        if self._csv_file is not None or self._jsonl_file is not None:
+            return
+        self._output_dir.mkdir(parents=True, exist_ok=True)
+        if self._format_type in ["csv", "both"]:
+            self._csv_file = self._output_path("csv").open(
+                "w", newline="", encoding="utf-8"
+            )
+            self._csv_writer = csv.writer(self._csv_file)
+            self._csv_writer.writerow(self._CSV_FIELDS)
+        if self._format_type in ["json", "both"]:
+            self._jsonl_file = self._output_path("jsonl").open("wb")
 
     def get_results(self) -> List[Dict[str, Any]]:
         """Get all results as dictionaries."""
@@ -537,43 +872,14 @@ class BenchmarkResultsManager:
         """Get sequential times for a specific parser and dataset size."""
         return [
             result.total_ser_deser_time_ms
-            for result in self._results
-            if (
-                result.parser_name == parser_name
-                and result.dataset_size == dataset_size
-                and result.success
-            )
+            for result in self._by_group.get((parser_name, dataset_size), ())
+            if result.success
         ]
 
     @staticmethod
     def _metrics_to_dict(metrics: BenchmarkMetrics) -> Dict[str, Any]:
         """Convert metrics to dictionary."""
-        return {
-            "parser_name": metrics.parser_name,
-            "dataset_size": metrics.dataset_size,
-            "run_number": metrics.run_number,
-            "protocol": metrics.protocol,
-            "timestamp": metrics.timestamp,
-            "success": metrics.success,
-            "error": metrics.error,
-            "serialize_time_ms": metrics.serialize_time_ms,
-            "deserialize_time_ms": metrics.deserialize_time_ms,
-            "total_ser_deser_time_ms": metrics.total_ser_deser_time_ms,
-            "total_with_conversions_ms": metrics.total_with_conversions_ms,
-            "throughput_mbps": metrics.throughput_mbps,
-            "cpu_time_seconds": metrics.cpu_time_seconds,
-            "memory_current_bytes": metrics.memory_current_bytes,
-            "memory_peak_bytes": metrics.memory_peak_bytes,
-            "synchronization_overhead_ms": metrics.synchronization_overhead_ms,
-            "network_latency_ms": metrics.network_latency_ms,
-            "speedup": metrics.speedup,
-            "efficiency": metrics.efficiency,
-            "amdahl_theoretical_speedup": metrics.amdahl_theoretical_speedup,
-            "algorithm_name": metrics.algorithm_name,
-            "time_complexity": metrics.time_complexity,
-            "space_complexity": metrics.space_complexity,
-            "overall_complexity": metrics.overall_complexity,
-        }
+        return dict(zip(_METRICS_FIELDS, _METRICS_GETTER(metrics)))
 
 
 class BenchmarkSummaryGenerator:
@@ -610,9 +916,9 @@ class BenchmarkSummaryGenerator:
         if not successful_results:
             return
 
-        top_throughput = sorted(
-            successful_results, key=lambda x: x.get("throughput_mbps", 0), reverse=True
-        )[:5]
+        top_throughput = heapq.nlargest(
+            5, successful_results, key=lambda x: x.get("throughput_mbps", 0)
+        )
 
         print("\nTop 5 Performers (Throughput):")
         for i, result in enumerate(top_throughput, 1):
@@ -635,12 +941,53 @@ class BenchmarkSummaryGenerator:
         for size in sorted(datasets.keys()):
             size_results = [r for r in successful_results if r["dataset_size"] == size]
             if size_results:
-                avg_time = sum(
+                avg_time = statistics.fmean(
                     r["total_ser_deser_time_ms"] for r in size_results
-                ) / len(size_results)
+                )
                 print(f"  {size:,} fields: {avg_time:.2f} ms")
 
 
+# Per-process runner used by the --parallel-parsers worker pool
+_worker_single_run: Optional[SingleRunBenchmark] = None
+
+
+def _init_parser_worker(
+    src_root: str, deep_memory_profile: bool, cpu_counter: Any
+) -> None:
+    """Build the worker's benchmark components and pin it to a single CPU."""
+    global _worker_single_run
+    _add_src_to_path(src_root)
+    _worker_single_run = SingleRunBenchmark(
+        NetworkSimulatorFactory(), MetricsCollector(deep_memory_profile)
+    )
+
+    # Pinning keeps per-run timings from being skewed by CPU migration
+    if hasattr(os, "sched_setaffinity"):
+        with cpu_counter.get_lock():
+            index = cpu_counter.value
+            cpu_counter.value += 1
+        cpus = sorted(os.sched_getaffinity(0))
+        os.sched_setaffinity(0, {cpus[index % len(cpus)]})
+
+
+def _run_parser_dataset(
+    parser_name: str,
+    parser_path: str,
+    dataset: TestDataset,
+    runs_per_test: int,
+    protocols: List[str],
+) -> List[BenchmarkMetrics]:
+    """Run every protocol and run for one parser and dataset in a pool worker."""
+    parser_class = _import_parser(parser_path)
+    # Discarded warm-up run, as in the serial path
+    _worker_single_run.execute(parser_name, parser_class, dataset, 0, protocols[0])
+    return [
+        _worker_single_run.execute(parser_name, parser_class, dataset, run + 1, protocol)
+        for protocol in protocols
+        for run in range(runs_per_test)
+    ]
+
+
 class StreamingParserBenchmark:
     """Main benchmarking class for streaming JSON parsers."""
 
@@ -650,15 +997,22 @@ class StreamingParserBenchmark:
 
         # Initialize components
         self.parser_discovery = ParserDiscovery()
-        self.dataset_generator = TestDatasetGenerator()
+        self.dataset_generator = TestDatasetGenerator(
+            self.output_dir / ".datasets" if config.cache_datasets else None
+        )
         self.network_factory = NetworkSimulatorFactory()
-        self.metrics_collector = MetricsCollector()
+        self.metrics_collector = MetricsCollector(config.deep_memory_profile)
         self.single_run_benchmark = SingleRunBenchmark(
             self.network_factory, self.metrics_collector
         )
-        self.parallel_benchmark = ParallelBenchmark()
+        self.parallel_benchmark = ParallelBenchmark(
+            max_workers=min(4, multiprocessing.cpu_count()),
+            metrics_collector=self.metrics_collector,
+        )
         self.speedup_calculator = SpeedupCalculator()
-        self.results_manager = BenchmarkResultsManager()
+        self.results_manager = BenchmarkResultsManager(
+            self.output_dir, config.output_format
+        )
         self.summary_generator = BenchmarkSummaryGenerator()
 
         # Load parsers and generate datasets
@@ -686,8 +1040,11 @@ class StreamingParserBenchmark:
             * len(self.config.protocols)
         )
 
-        with tqdm(total=total_tests, desc="Running benchmarks") as pbar:
-            self._execute_benchmarks(pbar)
+        try:
+            with tqdm(total=total_tests, desc="Running benchmarks") as pbar:
+                self._execute_benchmarks(pbar)
+        finally:
+            self.parallel_benchmark.shutdown()
 
         print(
             f"\n✅ Benchmark completed! {len(self.results_manager.get_results())} test results collected."
@@ -695,25 +1052,99 @@ class StreamingParserBenchmark:
 
     def _execute_benchmarks(self, pbar: tqdm) -> None:
         """Execute all benchmark combinations."""
+        if self.config.parallel_parsers:
+            self._execute_benchmarks_parallel(pbar)
+            return
+
         for parser_name, parser_class in self.parsers.items():
             for dataset_size, dataset in self.test_data.items():
                 self._benchmark_parser_dataset(parser_name, parser_class, dataset, pbar)
 
+    def _execute_benchmarks_parallel(self, pbar: tqdm) -> None:
+        """Benchmark (parser, dataset) pairs concurrently in worker processes.
+
+        Speedups are measured once the pinned pool has shut down, so the
+        ParallelBenchmark workers never compete with pinned runs for CPUs.
+        """
+        cpu_counter = multiprocessing.Value("i", 0)
+        finished_groups = []
+        with ProcessPoolExecutor(
+            max_workers=max(1, multiprocessing.cpu_count() - 1),
+            initializer=_init_parser_worker,
+            initargs=(str(SRC_ROOT), self.config.deep_memory_profile, cpu_counter),
+        ) as executor:
+            futures = {
+                executor.submit(
+                    _run_parser_dataset,
+                    parser_name,
+                    _parser_path(parser_class),
+                    dataset,
+                    self.config.runs_per_test,
+                    self.config.protocols,
+                ): (parser_name, parser_class, dataset)
+                for parser_name, parser_class in self.parsers.items()
+                for dataset in self.test_data.values()
+            }
+
+            for future in as_completed(futures):
+                parser_name, parser_class, dataset = futures[future]
+                try:
+                    group_metrics = future.result()
+                except Exception as e:
+                    # Import errors and worker crashes fail this group only
+                    group_metrics = self._failed_group_metrics(parser_name, dataset, str(e))
+                for metrics in group_metrics:
+                    self.results_manager.add_result(metrics)
+                pbar.update(len(group_metrics))
+                finished_groups.append((parser_name, parser_class, dataset))
+
+        for parser_name, parser_class, dataset in finished_groups:
+            self._calculate_speedup_metrics(parser_name, parser_class, dataset)
+            self.results_manager.flush_group(parser_name, dataset.size)
+
+    def _failed_group_metrics(
+        self, parser_name: str, dataset: TestDataset, error: str
+    ) -> List[BenchmarkMetrics]:
+        """Return one failed result per run of a group that could not be benchmarked."""
+        return [
+            BenchmarkMetrics(
+                parser_name=parser_name,
+                dataset_size=dataset.size,
+                run_number=run + 1,
+                protocol=protocol,
+                timestamp=time.time(),
+                success=False,
+                error=error,
+            )
+            for protocol in self.config.protocols
+            for run in range(self.config.runs_per_test)
+        ]
+
     def _benchmark_parser_dataset(
         self, parser_name: str, parser_class: type, dataset: TestDataset, pbar: tqdm
     ) -> None:
         """Benchmark a parser with a specific dataset."""
+        # Discarded warm-up run so one-time costs (lazy imports, caches) stay
+        # out of the measured runs
+        self.single_run_benchmark.execute(
+            parser_name, parser_class, dataset, 0, self.config.protocols[0]
+        )
+
         # Run sequential benchmarks for each protocol
+        completed = 0
         for protocol in self.config.protocols:
             for run in range(self.config.runs_per_test):
                 metrics = self.single_run_benchmark.execute(
                     parser_name, parser_class, dataset, run + 1, protocol
                 )
                 self.results_manager.add_result(metrics)
-                pbar.update(1)
+                completed += 1
+        # One progress update per group keeps tqdm redraws out of the run loop
+        pbar.update(completed)
 
         # Run parallel benchmark for speedup calculation
         self._calculate_speedup_metrics(parser_name, parser_class, dataset)
+        self.results_manager.flush_group(parser_name, dataset.size)
 
     def _calculate_speedup_metrics(
         self, parser_name: str, parser_class: type, dataset: TestDataset
@@ -726,8 +1157,6 @@ class StreamingParserBenchmark:
 
             if sequential_times:
                 parallel_result = self.parallel_benchmark.execute(parser_class, dataset)
-                if not isinstance(parallel_result, dict):
-                    raise TypeError(f"Expected dict, got {type(parallel_result)}")
 
                 speedup_data = self.speedup_calculator.calculate_speedup(
                     sequential_times, parallel_result
@@ -740,20 +1169,10 @@ class StreamingParserBenchmark:
         except Exception as e:
             print(f"Error calculating speedup metrics: {str(e)}")
 
-    def save_results(self, format_type: str = "both") -> None:
-        """Save benchmark results to files."""
-        timestamp = time.strftime("%Y%m%d_%H%M%S")
-        results = self.results_manager.get_results()
-
-        if format_type in ["csv", "both"]:
-            csv_file = self.output_dir / f"benchmark_results_{timestamp}.csv"
-            save_results(results, csv_file, "csv")
-            print(f"📊 Results saved to: {csv_file}")
-
-        if format_type in ["json", "both"]:
-            json_file = self.output_dir / f"benchmark_results_{timestamp}.json"
-            save_results(results, json_file, "json")
-            print(f"📊 Results saved to: {json_file}")
+    def save_results(self) -> None:
+        """Finish the result files streamed during the run."""
+        for output_file in self.results_manager.close():
+            print(f"📊 Results saved to: {output_file}")
 
     def print_summary(self) -> None:
         """Print a summary of benchmark results."""
@@ -805,6 +1224,24 @@ Examples:
             "--quiet", "-q", action="store_true", help="Suppress progress output"
         )
 
+        parser.add_argument(
+            "--no-cache-datasets",
+            action="store_true",
+            help="Regenerate test datasets instead of reusing <output>/.datasets",
+        )
+
+        parser.add_argument(
+            "--deep-memory-profile",
+            action="store_true",
+            help="Trace every allocation with tracemalloc (slow, skews timings)",
+        )
+
+        parser.add_argument(
+            "--parallel-parsers",
+            action="store_true",
+            help="Benchmark parsers concurrently in pinned worker processes",
+        )
+
         return parser.parse_args()
 
 
@@ -814,7 +1251,7 @@ def main():
     args = arg_parser.parse_args()
 
     # Define the allowed base directory (project root)
-    project_root = str(Path(__file__).parent.absolute())
+    project_root = str(PROJECT_ROOT)
 
     try:
         # Sanitize and validate the output directory passed as argument
@@ -835,12 +1272,17 @@ def main():
     try:
         # Initialize and run benchmark
         config = BenchmarkConfig(
-            output_dir=str(sanitized_output_path), runs_per_test=args.runs
+            output_dir=str(sanitized_output_path),
+            runs_per_test=args.runs,
+            cache_datasets=not args.no_cache_datasets,
+            deep_memory_profile=args.deep_memory_profile,
+            output_format=args.format,
+            parallel_parsers=args.parallel_parsers,
         )
 
         benchmark = StreamingParserBenchmark(config)
         benchmark.run_comprehensive_benchmark()
-        benchmark.save_results(args.format)
+        benchmark.save_results()
 
         if not args.quiet:
             benchmark.print_summary()
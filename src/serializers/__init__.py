@@ -3,21 +3,34 @@
 from __future__ import annotations
 
 import inspect
-from types import ModuleType
+from types import FunctionType, ModuleType
 from typing import Callable, Iterable, List, Optional
 
+# Code flags for *args/**kwargs; either makes a function accept arguments.
+_VARIADIC_FLAGS = inspect.CO_VARARGS | inspect.CO_VARKEYWORDS
+
+
+def _takes_no_arguments(obj: Callable) -> bool:
+    """Return whether ``obj`` can be called without arguments."""
+    if isinstance(obj, FunctionType) and not hasattr(obj, "__wrapped__"):
+        # Plain functions answer from their code object; no Signature needed.
+        code = obj.__code__
+        return not (code.co_argcount or code.co_kwonlyargcount or code.co_flags & _VARIADIC_FLAGS)
+    try:
+        return not inspect.signature(obj).parameters
+    except (TypeError, ValueError):
+        # Builtins or callables without a signature
+        return False
+
 
 def _collect_tests(module: ModuleType) -> List[Callable[[], None]]:
     """Return zero-argument callables whose names start with ``test_``."""
     tests: List[Callable[[], None]] = []
-    for name, obj in inspect.getmembers(module):
-        if name.startswith("test_") and callable(obj):
-            try:
-                if not inspect.signature(obj).parameters:
-                    tests.append(obj)
-            except (TypeError, ValueError):
-                # Builtins or callables without a signature
-                continue
+    for name, obj in sorted(vars(module).items()):
+        if not name.startswith("test_"):
+            continue
+        if callable(obj) and _takes_no_arguments(obj):
+            tests.append(obj)
     return tests
 
 
@@ -0,0 +1,406 @@
+"""
+Shared backend of the anyio FlatBuffers, MessagePack and orjson parsers.
+
+These parsers differ only in name and metadata, so their document scanning,
+decoding and validation live here once; each parser module subclasses
+AsyncParserBase as its StreamingJsonParser.
+"""
+import json
+import re
+import anyio
+import numpy as np
+from collections import OrderedDict
+from typing import Any, Dict, Optional, List, Tuple, Union
+
+
+# Document scanner tokens, found in one finditer pass over the byte buffer: a
+# whole string literal (group 1 is its closing quote, missing while the
+# literal is still open), a brace, or a backslash with the byte it escapes.
+# Everything else is skipped inside the regex engine; UTF-8 continuation
+# bytes never equal an ASCII structural character, so scanning bytes is safe.
+_TOKEN = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*(")?|[{}]|\\.?', re.DOTALL)
+# Remainder of a string literal up to its closing quote (or a trailing lone
+# backslash), for resuming a literal left open by the previous chunk.
+_STRING_BODY = re.compile(rb'[^"\\]*(?:\\.[^"\\]*)*', re.DOTALL)
+# Braces alone, for unscanned text holding no string literal or escape.
+_BRACE = re.compile(rb'[{}]')
+_BACKSLASH, _QUOTE, _OPEN_BRACE, _CLOSE_BRACE = ord('\\'), ord('"'), ord('{'), ord('}')
+# Documents from this length on have their braces counted with numpy, in
+# blocks small enough for the comparison results to stay in cache.
+_VECTOR_COUNT_MIN_CHARS = 16384
+_VECTOR_COUNT_BLOCK = 65536
+# Text shorter than this is scanned on the event loop: the scan takes less
+# time than handing it to a worker thread and waking back up.
+_INLINE_MAX_CHARS = 8192
+# Complete documents arriving together are decoded as one JSON array from this
+# many on; below it, per-document decoding is as cheap.
+_BATCH_MIN_DOCUMENTS = 8
+
+
+def _brace_imbalance(doc_str: str) -> int:
+    """Return how many more '{' than '}' characters doc_str contains."""
+    if len(doc_str) < _VECTOR_COUNT_MIN_CHARS:
+        return doc_str.count('{') - doc_str.count('}')
+
+    data = np.frombuffer(doc_str.encode('utf-8', errors='surrogatepass'), dtype=np.uint8)
+    imbalance = 0
+    for start in range(0, len(data), _VECTOR_COUNT_BLOCK):
+        block = data[start:start + _VECTOR_COUNT_BLOCK]
+        imbalance += int(np.count_nonzero(block == _OPEN_BRACE)) - int(np.count_nonzero(block == _CLOSE_BRACE))
+    return imbalance
+
+
+class AsyncParserState:
+    """Mutable stream state of the async JSON parsers.
+
+    The buffer and the document scanner fields are updated in place on every
+    consume call, so the class uses ``__slots__`` rather than a per-instance
+    ``__dict__``.
+    """
+
+    __slots__ = ("buffer", "parsed_data", "scan_pos", "brace_count", "in_string", "escape_next")
+
+    def __init__(self, buffer: Optional[bytearray] = None, parsed_data: Optional[Dict[str, Any]] = None) -> None:
+        self.buffer: bytearray = buffer if buffer is not None else bytearray()
+        self.parsed_data: Dict[str, Any] = parsed_data if parsed_data is not None else {}
+        # Document scanner position in ``buffer``, resumed on the next consume.
+        self.scan_pos = 0
+        self.brace_count = 0
+        self.in_string = False
+        self.escape_next = False
+
+
+# Every JSON value type is valid for storage.
+_VALID_TYPES = (str, int, float, bool, list, dict)
+# Short documents whose values are all immutable scalars are remembered, so a
+# repeated payload (heartbeats, status documents) skips decoding and
+# validation. Results holding lists or dicts are not cached, as callers could
+# mutate them through the parsed state.
+_DOCUMENT_CACHE_SIZE = 1024
+_CACHEABLE_MAX_CHARS = 1024
+_IMMUTABLE_TYPES = frozenset((str, int, float, bool, type(None)))
+
+
+class AsyncJsonValidator:
+    """Validator for streamed JSON documents."""
+
+    @staticmethod
+    def is_valid_key(key: Any) -> bool:
+        """Check if the key is valid for storage."""
+        return isinstance(key, str) and len(key) > 0
+
+    @staticmethod
+    def is_valid_value(value: Any) -> bool:
+        """Check if the value is valid for storage."""
+        return value is None or isinstance(value, _VALID_TYPES)
+
+
+class AsyncJsonExtractor:
+    """Extractor for complete key-value pairs.
+
+    Pairs are validated inline; the checks are too cheap to schedule as tasks,
+    or even to call through AsyncJsonValidator once per pair.
+    """
+
+    @staticmethod
+    def extract_complete_pairs(obj: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract complete key-value pairs with validation."""
+        if not isinstance(obj, dict):
+            return {}
+
+        # Same checks as AsyncJsonValidator.is_valid_key and is_valid_value.
+        return {
+            key: value for key, value in obj.items()
+            if isinstance(key, str) and key and (value is None or isinstance(value, _VALID_TYPES))
+        }
+
+
+class AsyncJsonDocumentParser:
+    """Async parser for individual JSON documents."""
+
+    def __init__(self, extractor: AsyncJsonExtractor = None):
+        self._extractor = extractor or AsyncJsonExtractor()
+        self._document_cache: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+
+    async def parse_document(self, doc_str: str) -> Dict[str, Any]:
+        """Async parse a JSON document."""
+        parsed_obj = await self._try_direct_parse_async(doc_str)
+        if parsed_obj is not None:
+            return self._extractor.extract_complete_pairs(parsed_obj)
+
+        return await self._try_partial_parse_async(doc_str)
+
+    def parse_documents_sync(self, documents: List[str]) -> Dict[str, Any]:
+        """Parse complete documents in order, merging their pairs.
+
+        Large batches are joined into a single array so the decoder runs once;
+        if that array does not decode to exactly one object per document, the
+        documents are parsed one at a time instead.
+        """
+        parsed_data = {}
+        if len(documents) >= _BATCH_MIN_DOCUMENTS:
+            try:
+                objs = json.loads('[' + ','.join(documents) + ']')
+            except ValueError:
+                objs = None
+            if objs is not None and len(objs) == len(documents) and all(isinstance(obj, dict) for obj in objs):
+                for obj in objs:
+                    parsed_data.update(self._extractor.extract_complete_pairs(obj))
+                return parsed_data
+
+        for doc in documents:
+            parsed_data.update(self.parse_document_sync(doc))
+        return parsed_data
+
+    def parse_document_sync(self, doc_str: str) -> Dict[str, Any]:
+        """Parse a JSON document on the calling thread, reusing cached results."""
+        cached = self._document_cache.get(doc_str)
+        if cached is not None:
+            self._document_cache.move_to_end(doc_str)
+            return cached.copy()
+
+        result = self._parse_document_uncached(doc_str)
+        if len(doc_str) <= _CACHEABLE_MAX_CHARS and _IMMUTABLE_TYPES.issuperset(map(type, result.values())):
+            if len(self._document_cache) >= _DOCUMENT_CACHE_SIZE:
+                # Evict the least recently used document.
+                self._document_cache.popitem(last=False)
+            self._document_cache[doc_str] = result
+            return result.copy()
+        return result
+
+    def _parse_document_uncached(self, doc_str: str) -> Dict[str, Any]:
+        """Decode a JSON document and extract its pairs."""
+        parsed_obj = self._try_direct_parse(doc_str)
+        if parsed_obj is not None:
+            return self._extractor.extract_complete_pairs(parsed_obj)
+
+        balanced_doc = self._balance_braces(doc_str)
+        return self._parse_balanced(balanced_doc) if balanced_doc else {}
+
+    @staticmethod
+    def _try_direct_parse(doc_str: str) -> Optional[Dict[str, Any]]:
+        """Try direct JSON parsing of a document."""
+        try:
+            obj = json.loads(doc_str)
+            return obj if isinstance(obj, dict) else None
+        except json.JSONDecodeError:
+            return None
+
+    async def _try_direct_parse_async(self, doc_str: str) -> Optional[Dict[str, Any]]:
+        """Async try direct JSON parsing of a document."""
+        # Decoding is cheaper than a hop to a worker thread.
+        return self._try_direct_parse(doc_str)
+
+    async def _try_partial_parse_async(self, doc_str: str) -> Dict[str, Any]:
+        """Async try partial parsing with brace balancing."""
+        balanced_doc = await self._balance_braces_async(doc_str)
+        if not balanced_doc:
+            return {}
+
+        return self._parse_balanced(balanced_doc)
+
+    def parse_open_document_sync(self, doc_str: str, imbalance: int) -> Dict[str, Any]:
+        """Parse a document with ``imbalance`` braces still open.
+
+        The direct decode cannot succeed, so it is skipped, and the braces are
+        closed from the scanner's count instead of being counted again.
+        """
+        balanced_doc = self._balance_braces(doc_str, imbalance)
+        return self._parse_balanced(balanced_doc) if balanced_doc else {}
+
+    def _parse_balanced(self, balanced_doc: str) -> Dict[str, Any]:
+        """Decode a brace-balanced document and extract its pairs."""
+        try:
+            obj = json.loads(balanced_doc)
+            if isinstance(obj, dict):
+                return self._extractor.extract_complete_pairs(obj)
+        except json.JSONDecodeError:
+            pass
+
+        return {}
+
+    async def _balance_braces_async(self, doc_str: str) -> Optional[str]:
+        """Async balance JSON braces in document."""
+        return self._balance_braces(doc_str)
+
+    @staticmethod
+    def _balance_braces(doc_str: str, imbalance: Optional[int] = None) -> Optional[str]:
+        """Close the open braces of document, or return None if none are open.
+
+        ``imbalance`` is the open-brace count already known from the document
+        scanner; braces are only counted when it is not supplied.
+        """
+        if imbalance is None:
+            imbalance = _brace_imbalance(doc_str)
+        return doc_str + '}' * imbalance if imbalance > 0 else None
+
+
+class AsyncJsonProcessor:
+    """Main async processor splitting the stream into JSON documents."""
+
+    def __init__(self, parser: AsyncJsonDocumentParser = None):
+        self._parser = parser or AsyncJsonDocumentParser()
+
+    async def process_buffer(self, buffer: str) -> Dict[str, Any]:
+        """Async process a standalone buffer of JSON documents.
+
+        The whole buffer is handed to one worker thread, not one task per
+        document: decoding holds the GIL, so per-document tasks only add
+        scheduling overhead. Short buffers are processed inline.
+        """
+        if len(buffer) < _INLINE_MAX_CHARS:
+            return self._process_buffer_sync(buffer)
+        return await anyio.to_thread.run_sync(self._process_buffer_sync, buffer)
+
+    def _process_buffer_sync(self, buffer: str) -> Dict[str, Any]:
+        """Process a standalone buffer on the calling thread.
+
+        Documents are merged in order, so later documents win on repeated keys.
+        """
+        documents = self._extract_documents_sync(buffer)
+        complete = [doc for doc, imbalance in documents if imbalance == 0]
+        parsed_data = self._parser.parse_documents_sync(complete)
+        for doc, imbalance in documents[len(complete):]:
+            parsed_data.update(self._parser.parse_open_document_sync(doc, imbalance))
+        return parsed_data
+
+    def _process_state_sync(self, state: AsyncParserState) -> Dict[str, Any]:
+        """Process the buffered stream, dropping documents once complete.
+
+        Only the document still being streamed stays in ``state.buffer``, so
+        the buffer is bounded by the largest document, not the whole stream,
+        and the scan resumes where the previous chunk left it.
+        """
+        parsed_data = self._parser.parse_documents_sync(self._scan_documents(state))
+        if state.brace_count > 0:
+            # A multi-byte character cut off by the chunk boundary is left out.
+            open_doc = state.buffer.decode('utf-8', errors='ignore').strip()
+            parsed_data.update(self._parser.parse_open_document_sync(open_doc, state.brace_count))
+        return parsed_data
+
+    @staticmethod
+    def _extract_documents_sync(text: str) -> List[Tuple[str, int]]:
+        """Sync helper to extract documents with their count of unclosed braces."""
+        state = AsyncParserState(buffer=bytearray(text.encode('utf-8')))
+        documents = [(doc, 0) for doc in AsyncJsonProcessor._scan_documents(state)]
+        trailing_doc = state.buffer.decode('utf-8').strip()
+        if trailing_doc and state.brace_count > 0:
+            documents.append((trailing_doc, state.brace_count))
+
+        return documents
+
+    @staticmethod
+    def _scan_documents(state: AsyncParserState) -> List[str]:
+        """Resume the document scan at ``state.scan_pos`` and return completed documents.
+
+        Documents are sliced out by index and decoded when their braces
+        balance, then deleted from the front of the byte buffer. The scan visits one token per
+        string literal, brace or escape rather than one per character. The
+        scanner state is stored back on ``state``, so no character is scanned
+        twice across consume calls.
+        """
+        text = state.buffer
+        brace_count = state.brace_count
+        in_string = state.in_string
+        escape_next = state.escape_next
+        documents = []
+        doc_start = 0
+        position = state.scan_pos
+        text_len = len(text)
+
+        if escape_next and position < text_len:
+            escape_next = False
+            position += 1
+
+        if in_string and not escape_next:
+            position = _STRING_BODY.match(text, position).end()
+            if position < text_len:
+                # Either the closing quote or a backslash whose escaped
+                # character may arrive with the next chunk.
+                escape_next = text[position] == _BACKSLASH
+                in_string = escape_next
+                position += 1
+
+        if in_string or escape_next:
+            pass
+        elif text.find(b'"', position) < 0 and text.find(b'\\', position) < 0:
+            # No string literal or escape starts in the unscanned text, such as
+            # the body of a numeric array, so only braces matter.
+            if text.find(b'}', position) < 0:
+                # Nothing closes, so no document can complete.
+                brace_count += text.count(b'{', position)
+            else:
+                for match in _BRACE.finditer(text, position):
+                    if text[match.start()] == _OPEN_BRACE:
+                        brace_count += 1
+                    else:
+                        brace_count -= 1
+                        if brace_count == 0:
+                            position = match.end()
+                            documents.append(text[doc_start:position].decode('utf-8', errors='replace').strip())
+                            doc_start = position
+        else:
+            for match in _TOKEN.finditer(text, position):
+                char = text[match.start()]
+                if char == _OPEN_BRACE:
+                    brace_count += 1
+                elif char == _CLOSE_BRACE:
+                    brace_count -= 1
+                    if brace_count == 0:
+                        position = match.end()
+                        documents.append(text[doc_start:position].decode('utf-8', errors='replace').strip())
+                        doc_start = position
+                elif char == _QUOTE:
+                    if match.group(1) is None:
+                        # The literal runs to the end of the text, or stops at
+                        # a final lone backslash.
+                        in_string = True
+                        escape_next = match.end() < text_len
+                else:
+                    # A lone final backslash escapes the next chunk's first character.
+                    escape_next = match.end() - match.start() == 1
+
+        del text[:doc_start]
+        state.scan_pos = len(text)
+        state.brace_count = brace_count
+        state.in_string = in_string
+        state.escape_next = escape_next
+        return documents
+
+
+class AsyncParserBase:
+    """Async streaming JSON parser shared by the FlatBuffers, MessagePack and orjson parsers."""
+
+    # consume() accepts the benchmark's bytes chunks and the document scanner
+    # resumes across calls, so one pre-joined chunk is equivalent
+    SUPPORTS_BATCH = True
+
+    def __init__(self, processor: AsyncJsonProcessor = None):
+        """Initialize the async streaming JSON parser."""
+        self._state = AsyncParserState()
+        self._processor = processor or AsyncJsonProcessor()
+
+    def consume(self, buffer: Union[str, bytes]) -> None:
+        """Process a chunk of JSON data incrementally.
+
+        Text chunks are UTF-8 encoded and bytes appended as they are, so the
+        buffer grows in place. Parsing is CPU-bound, so it runs on the calling
+        thread instead of starting an event loop per chunk.
+        """
+        self._state.buffer += buffer.encode('utf-8') if isinstance(buffer, str) else buffer
+        self._state.parsed_data.update(self._processor._process_state_sync(self._state))
+
+    def get(self) -> Dict[str, Any]:
+        """Return current parsed state as a Python object."""
+        return self._state.parsed_data.copy()
+
+    async def _consume_async(self, buffer: Union[str, bytes]) -> None:
+        """Async process a chunk of JSON data incrementally."""
+        if len(buffer) < _INLINE_MAX_CHARS:
+            self.consume(buffer)
+        else:
+            await anyio.to_thread.run_sync(self.consume, buffer)
+
+    async def _get_async(self) -> Dict[str, Any]:
+        """Async return current parsed state as a Python object."""
+        return self.get()
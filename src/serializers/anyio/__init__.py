@@ -11,7 +11,8 @@ class AnyioWrapper:
 
     def __init__(self, parser_factory: Callable[[], Any]):
         self._parser = parser_factory()
-        self._lock = anyio.Lock()
+        # Uncontended acquires skip the scheduler checkpoint.
+        self._lock = anyio.Lock(fast_acquire=True)
 
     async def consume_async(self, buffer: Any) -> None:
         """Asynchronously consume data using a background worker."""
@@ -19,8 +20,12 @@ class AnyioWrapper:
             await anyio.to_thread.run_sync(self._parser.consume, buffer)
 
     def consume(self, buffer: Any) -> None:
-        """Consume data synchronously using AnyIO's runner."""
-        anyio.run(self.consume_async, buffer)
+        """Consume data synchronously on the calling thread.
+
+        Like :meth:`get`, this calls the wrapped parser directly rather than
+        starting an event loop for every buffer.
+        """
+        self._parser.consume(buffer)
 
     async def get_async(self) -> Dict[str, Any]:
         """Asynchronously retrieve parsed data."""
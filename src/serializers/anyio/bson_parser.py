@@ -13,73 +13,116 @@ Key Features:
 - Comprehensive error handling and recovery
 """
 import json
+import re
 import anyio
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional, List
-from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional, List, Tuple, Union
+
+
+# Structural characters for the document scanner. Jumping between them with a
+# compiled search keeps the per-character work in the regex engine.
+_STRUCTURAL_CHARS = re.compile(r'[{}"\\]')
+# Remainder of a string literal up to its closing quote (or a trailing lone
+# backslash); matched in one step so quoted braces are never visited.
+_STRING_BODY = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*', re.DOTALL)
+# Byte-level counterparts used on the stream buffer. UTF-8 continuation bytes
+# never equal an ASCII structural character, so scanning bytes is safe.
+_STRUCTURAL_BYTES = re.compile(rb'[{}"\\]')
+_STRING_BODY_BYTES = re.compile(rb'[^"\\]*(?:\\.[^"\\]*)*', re.DOTALL)
+_BACKSLASH, _QUOTE, _OPEN_BRACE = ord('\\'), ord('"'), ord('{')
+# Text shorter than this is scanned on the event loop: the scan takes less
+# time than handing it to a worker thread and waking back up.
+_INLINE_MAX_CHARS = 8192
+# Complete documents arriving together are decoded as one JSON array from this
+# many on; below it, per-document decoding is as cheap.
+_BATCH_MIN_DOCUMENTS = 8
+# A complete quoted key and its colon, with the whitespace that follows.
+_KEY_PATTERN = re.compile(r'"((?:[^"\\]|\\.)*)"\s*:\s*', re.DOTALL)
+
+
+def _unescape(raw: str) -> str:
+    """Decode JSON escapes in a raw string body, keeping it as is if it cannot decode."""
+    if '\\' not in raw:
+        return raw
+    try:
+        return json.loads('"' + raw + '"')
+    except ValueError:
+        return raw
 
 
 @dataclass
 class AsyncParserState:
-    """Immutable state container for async BSON parser."""
-    buffer: str = ""
+    """Mutable stream state of the async BSON parser.
+
+    The buffer and the document scanner fields are updated in place on every
+    consume call.
+    """
+    buffer: bytearray = field(default_factory=bytearray)
     parsed_data: Dict[str, Any] = field(default_factory=dict)
+    # Document scanner position in ``buffer``, resumed on the next consume.
+    scan_pos: int = 0
+    brace_count: int = 0
+    in_string: bool = False
+    escape_next: bool = False
+
+
+# Scalar value types valid as-is. List items of exactly these types skip the
+# recursive check with a single set lookup.
+_SCALAR_TYPES = (str, int, float, bool)
+_EXACT_SCALAR_TYPES = frozenset(_SCALAR_TYPES + (type(None),))
 
 
 class AsyncDocumentValidator:
-    """Async validator for BSON-style documents."""
+    """Validator for BSON-style documents.
+
+    Checks are plain type tests, so they run inline rather than as tasks.
+    """
 
     @staticmethod
-    async def is_valid_key(key: Any) -> bool:
-        """Async check if the key is valid for BSON-style storage."""
-        return isinstance(key, str) and len(key) > 0
+    def is_valid_key(key: Any) -> bool:
+        """Check if the key is valid for BSON-style storage."""
+        return isinstance(key, str) and bool(key)
 
     @staticmethod
-    async def is_valid_value(value: Any) -> bool:
-        """Async check if the value is valid for BSON-style storage."""
-        if value is None or isinstance(value, (str, int, float, bool)):
+    def is_valid_value(value: Any) -> bool:
+        """Check if the value is valid for BSON-style storage."""
+        if value is None or isinstance(value, _SCALAR_TYPES):
             return True
 
         if isinstance(value, list):
-            async with anyio.create_task_group() as tg:
-                results = []
-                for item in value:
-                    tg.start_soon(AsyncDocumentValidator._validate_item, item, results)
-                return all(results)
+            return all(
+                type(item) in _EXACT_SCALAR_TYPES or AsyncDocumentValidator.is_valid_value(item)
+                for item in value
+            )
 
         if isinstance(value, dict):
             return all(isinstance(k, str) for k in value.keys())
 
         return False
 
-    @staticmethod
-    async def _validate_item(item: Any, results: List[bool]) -> None:
-        """Helper to validate list items asynchronously."""
-        result = await AsyncDocumentValidator.is_valid_value(item)
-        results.append(result)
-
 
 class AsyncPairExtractor:
-    """Async extractor for complete key-value pairs."""
+    """Extractor for complete key-value pairs."""
 
     @staticmethod
-    async def extract_complete_pairs(obj: Dict[str, Any]) -> Dict[str, Any]:
-        """Async extract complete key-value pairs with BSON-style validation."""
+    def extract_complete_pairs(obj: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract complete key-value pairs with BSON-style validation."""
         if not isinstance(obj, dict):
             return {}
 
-        result = {}
-        async with anyio.create_task_group() as tg:
-            for key, value in obj.items():
-                tg.start_soon(AsyncPairExtractor._process_pair, key, value, result)
-
-        return result
+        return {
+            key: value for key, value in obj.items()
+            if isinstance(key, str) and key and AsyncDocumentValidator.is_valid_value(value)
+        }
 
     @staticmethod
-    async def _process_pair(key: str, value: Any, result: Dict[str, Any]) -> None:
-        """Process a single key-value pair asynchronously."""
-        if await AsyncDocumentValidator.is_valid_key(key) and await AsyncDocumentValidator.is_valid_value(value):
-            result[key] = value
+    def extract_decoded_pairs(obj: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract pairs from an object produced by the JSON decoder.
+
+        Decoded keys are always strings and values always JSON types, so only
+        empty keys need dropping.
+        """
+        return {key: value for key, value in obj.items() if key}
 
 
 class AsyncDocumentParser:
@@ -87,59 +130,66 @@ class AsyncDocumentParser:
 
     def __init__(self, pair_extractor: AsyncPairExtractor = None):
         self._pair_extractor = pair_extractor or AsyncPairExtractor()
-        self._executor = ThreadPoolExecutor(max_workers=2)
 
-    async def parse_document(self, doc_str: str) -> Dict[str, Any]:
-        """Async parse a BSON-style document."""
-        # Try direct JSON parsing in thread pool
-        parsed_obj = await self._try_direct_parse_async(doc_str)
-        if parsed_obj:
-            return await self._pair_extractor.extract_complete_pairs(parsed_obj)
+    def parse_documents_sync(self, documents: List[str]) -> Dict[str, Any]:
+        """Parse complete BSON-style documents in order, merging their pairs.
 
-        # Try partial parsing with balancing
-        return await self._try_partial_parse_async(doc_str)
+        Large batches are joined into a single array so the decoder runs once;
+        if that array does not decode to exactly one object per document, the
+        documents are parsed one at a time instead.
+        """
+        parsed_data = {}
+        if len(documents) >= _BATCH_MIN_DOCUMENTS:
+            try:
+                objs = json.loads('[' + ','.join(documents) + ']')
+            except ValueError:
+                objs = None
+            if objs is not None and len(objs) == len(documents) and all(isinstance(obj, dict) for obj in objs):
+                for obj in objs:
+                    parsed_data.update(self._pair_extractor.extract_decoded_pairs(obj))
+                return parsed_data
+
+        for doc in documents:
+            parsed_data.update(self.parse_document_sync(doc))
+        return parsed_data
 
-    async def _try_direct_parse_async(self, doc_str: str) -> Optional[Dict[str, Any]]:
-        """Async try direct JSON parsing of document."""
-        try:
-            obj = await anyio.to_thread.run_sync(json.loads, doc_str)
-            return obj if isinstance(obj, dict) else None
-        except json.JSONDecodeError:
-            return None
+    def parse_document_sync(self, doc_str: str) -> Dict[str, Any]:
+        """Parse a BSON-style document on the calling thread."""
+        parsed_obj = self._try_direct_parse(doc_str)
+        if parsed_obj is not None:
+            return self._pair_extractor.extract_decoded_pairs(parsed_obj)
 
-    async def _try_partial_parse_async(self, doc_str: str) -> Dict[str, Any]:
-        """Async try partial parsing with brace balancing."""
-        balanced_doc = await self._balance_braces_async(doc_str)
-        if not balanced_doc:
-            return await self._extract_partial_fields_async(doc_str)
+        return self.parse_open_document_sync(doc_str)
 
-        try:
-            obj = await anyio.to_thread.run_sync(json.loads, balanced_doc)
-            if isinstance(obj, dict):
-                return await self._pair_extractor.extract_complete_pairs(obj)
-        except json.JSONDecodeError:
-            pass
+    def parse_open_document_sync(self, doc_str: str, imbalance: Optional[int] = None) -> Dict[str, Any]:
+        """Parse a document whose braces are still open, skipping the direct decode."""
+        balanced_doc = self._balance_braces(doc_str, imbalance)
+        if balanced_doc:
+            obj = self._try_direct_parse(balanced_doc)
+            if obj is not None:
+                return self._pair_extractor.extract_decoded_pairs(obj)
 
-        return await self._extract_partial_fields_async(doc_str)
+        return self._extract_partial_fields_sync(doc_str)
 
-    async def _balance_braces_async(self, doc_str: str) -> Optional[str]:
-        """Async balance JSON braces in document."""
-        if '{' not in doc_str:
+    @staticmethod
+    def _try_direct_parse(doc_str: str) -> Optional[Dict[str, Any]]:
+        """Try direct JSON parsing of document."""
+        try:
+            obj = json.loads(doc_str)
+            return obj if isinstance(obj, dict) else None
+        except json.JSONDecodeError:
             return None
 
-        open_braces = doc_str.count('{')
-        close_braces = doc_str.count('}')
-
-        if open_braces > close_braces:
-            return doc_str + '}' * (open_braces - close_braces)
-        elif open_braces == close_braces and open_braces > 0:
-            return doc_str
-
-        return None
+    @staticmethod
+    def _balance_braces(doc_str: str, imbalance: Optional[int] = None) -> Optional[str]:
+        """Close the open braces of document, or return None if none are open.
 
-    async def _extract_partial_fields_async(self, doc_str: str) -> Dict[str, Any]:
-        """Extract partial key-value pairs from incomplete JSON."""
-        return await anyio.to_thread.run_sync(self._extract_partial_fields_sync, doc_str)
+        ``imbalance`` is the open-brace count already known from the document
+        scanner; braces are only counted when it is not supplied.
+        """
+        if imbalance is None:
+            imbalance = doc_str.count('{') - doc_str.count('}')
+        return doc_str + '}' * imbalance if imbalance > 0 else None
 
     @staticmethod
     def _extract_partial_fields_sync(doc_str: str) -> Dict[str, Any]:
@@ -148,43 +198,28 @@ class AsyncDocumentParser:
         position = 0
         
         while position < len(doc_str):
-            # Find next key
-            quote_pos = doc_str.find('"', position)
-            if quote_pos == -1:
-                break
-                
-            key_start = quote_pos + 1
-            key_end = doc_str.find('"', key_start)
-            if key_end == -1:
+            # Find the next complete key and its colon in one scan
+            key_match = _KEY_PATTERN.search(doc_str, position)
+            if key_match is None:
                 break
-                
-            key = doc_str[key_start:key_end]
-            
-            # Find colon
-            colon_pos = doc_str.find(':', key_end)
-            if colon_pos == -1:
-                break
-                
-            # Skip whitespace after colon
-            value_start = colon_pos + 1
-            while value_start < len(doc_str) and doc_str[value_start].isspace():
-                value_start += 1
-                
+
+            key = _unescape(key_match.group(1))
+            value_start = key_match.end()
             if value_start >= len(doc_str):
                 break
-                
+
             # Extract value (including partial strings and nested objects)
             if doc_str[value_start] == '"':
                 # String value (possibly partial)
                 string_start = value_start + 1
-                string_end = doc_str.find('"', string_start)
-                if string_end == -1:
+                string_end = _STRING_BODY.match(doc_str, string_start).end()
+                if string_end >= len(doc_str) or doc_str[string_end] != '"':
                     # Partial string - take everything to the end
-                    value = doc_str[string_start:]
+                    value = _unescape(doc_str[string_start:])
                     result[key] = value
                     break
                 else:
-                    value = doc_str[string_start:string_end]
+                    value = _unescape(doc_str[string_start:string_end])
                     result[key] = value
                     position = string_end + 1
             elif doc_str[value_start] == '{':
@@ -223,32 +258,35 @@ class AsyncDocumentParser:
             
         brace_count = 0
         in_string = False
-        escape_next = False
-        
-        for i in range(start_pos, len(text)):
-            char = text[i]
-            
-            if escape_next:
-                escape_next = False
+        position = start_pos
+        text_len = len(text)
+
+        while True:
+            if in_string:
+                position = _STRING_BODY.match(text, position).end()
+                if position >= text_len or text[position] == '\\':
+                    return -1
+                in_string = False
+                position += 1
                 continue
-                
+
+            match = _STRUCTURAL_CHARS.search(text, position)
+            if match is None:
+                return -1
+            i = match.start()
+            char = text[i]
+            position = i + 1
+
             if char == '\\':
-                escape_next = True
-                continue
-                
-            if char == '"' and not escape_next:
-                in_string = not in_string
-                continue
-                
-            if not in_string:
-                if char == '{':
-                    brace_count += 1
-                elif char == '}':
-                    brace_count -= 1
-                    if brace_count == 0:
-                        return i
-                        
-        return -1
+                position += 1
+            elif char == '"':
+                in_string = True
+            elif char == '{':
+                brace_count += 1
+            else:
+                brace_count -= 1
+                if brace_count == 0:
+                    return i
 
 
 class AsyncBsonProcessor:
@@ -258,62 +296,111 @@ class AsyncBsonProcessor:
         self._document_parser = document_parser or AsyncDocumentParser()
 
     async def process_buffer(self, buffer: str) -> Dict[str, Any]:
-        """Async process buffer using BSON-inspired document structure."""
-        documents = await self._extract_documents_async(buffer)
-        
-        parsed_data = {}
-        async with anyio.create_task_group() as tg:
-            for doc in documents:
-                tg.start_soon(self._process_document, doc, parsed_data)
-
+        """Async process buffer using BSON-inspired document structure.
+
+        The whole buffer is handed to one worker thread; short buffers are
+        processed inline.
+        """
+        if len(buffer) < _INLINE_MAX_CHARS:
+            return self._process_buffer_sync(buffer)
+        return await anyio.to_thread.run_sync(self._process_buffer_sync, buffer)
+
+    def _process_buffer_sync(self, buffer: str) -> Dict[str, Any]:
+        """Process buffer on the calling thread.
+
+        Documents take microseconds each, so they are parsed in order rather
+        than fanned out to tasks.
+        """
+        documents = self._extract_documents_sync(buffer)
+        parsed_data = self._document_parser.parse_documents_sync(
+            [doc for doc, imbalance in documents if imbalance == 0]
+        )
+        for doc, imbalance in documents:
+            if imbalance > 0:
+                parsed_data.update(self._document_parser.parse_open_document_sync(doc, imbalance))
         return parsed_data
 
-    async def _extract_documents_async(self, text: str) -> List[str]:
-        """Async extract JSON documents from text."""
-        return await anyio.to_thread.run_sync(self._extract_documents_sync, text)
+    def _process_state_sync(self, state: AsyncParserState) -> Dict[str, Any]:
+        """Process only the input appended to ``state.buffer`` since the last call."""
+        parsed_data = self._document_parser.parse_documents_sync(self._scan_documents(state))
+        if state.brace_count > 0:
+            # Only the open document is re-read; it cannot decode as it stands.
+            # A multi-byte character cut off by the chunk boundary is left out.
+            open_doc = state.buffer.decode('utf-8', errors='ignore').strip()
+            parsed_data.update(self._document_parser.parse_open_document_sync(open_doc, state.brace_count))
+        return parsed_data
 
     @staticmethod
-    def _extract_documents_sync(text: str) -> List[str]:
-        """Sync helper to extract documents."""
+    def _scan_documents(state: AsyncParserState) -> List[str]:
+        """Resume the document scan at ``state.scan_pos`` and return completed documents.
+
+        Completed documents are sliced out and decoded once, then deleted from
+        the front of the byte buffer, so every byte is scanned a single time
+        across consume calls and the buffer only ever holds the document still
+        being streamed.
+        """
+        text = state.buffer
+        brace_count = state.brace_count
+        in_string = state.in_string
+        escape_next = state.escape_next
         documents = []
-        current_doc = ""
-        brace_count = 0
-        in_string = False
-        escape_next = False
-
-        for char in text:
-            current_doc += char
-
-            if escape_next:
-                escape_next = False
-                continue
-
-            if char == '\\':
-                escape_next = True
-                continue
-
-            if char == '"' and not escape_next:
-                in_string = not in_string
+        doc_start = 0
+        position = state.scan_pos
+        text_len = len(text)
+
+        if escape_next and position < text_len:
+            escape_next = False
+            position += 1
+
+        while not escape_next:
+            if in_string:
+                position = _STRING_BODY_BYTES.match(text, position).end()
+                if position >= text_len:
+                    break
+                # Either the closing quote or a backslash whose escaped
+                # character may arrive with the next chunk.
+                escape_next = text[position] == _BACKSLASH
+                in_string = escape_next
+                position += 1
                 continue
 
-            if not in_string:
-                if char == '{':
-                    brace_count += 1
-                elif char == '}':
-                    brace_count -= 1
-                    if brace_count == 0 and current_doc.strip():
-                        documents.append(current_doc.strip())
-                        current_doc = ""
-
-        if current_doc.strip() and brace_count > 0:
-            documents.append(current_doc.strip())
-
+            match = _STRUCTURAL_BYTES.search(text, position)
+            if match is None:
+                break
+            i = match.start()
+            char = text[i]
+            position = i + 1
+
+            if char == _BACKSLASH:
+                # The escaped character may arrive with the next chunk.
+                escape_next = position >= text_len
+                position += 1
+            elif char == _QUOTE:
+                in_string = True
+            elif char == _OPEN_BRACE:
+                brace_count += 1
+            else:
+                brace_count -= 1
+                if brace_count == 0:
+                    documents.append(text[doc_start:position].decode('utf-8', errors='replace').strip())
+                    doc_start = position
+
+        del text[:doc_start]
+        state.scan_pos = len(text)
+        state.brace_count = brace_count
+        state.in_string = in_string
+        state.escape_next = escape_next
         return documents
 
-    async def _process_document(self, doc: str, parsed_data: Dict[str, Any]) -> None:
-        """Process a single document asynchronously."""
-        doc_data = await self._document_parser.parse_document(doc)
-        parsed_data.update(doc_data)
+    @staticmethod
+    def _extract_documents_sync(text: str) -> List[Tuple[str, int]]:
+        """Sync helper to extract documents with their count of unclosed braces."""
+        state = AsyncParserState(buffer=bytearray(text.encode('utf-8')))
+        documents = [(doc, 0) for doc in AsyncBsonProcessor._scan_documents(state)]
+        trailing_doc = state.buffer.decode('utf-8').strip()
+        if trailing_doc and state.brace_count > 0:
+            documents.append((trailing_doc, state.brace_count))
+        return documents
 
 
 def get_metadata():
@@ -333,29 +420,28 @@ def get_metadata():
 class StreamingJsonParser:
     """Async streaming JSON parser with BSON-inspired processing."""
 
+    # consume() accepts the benchmark's bytes chunks and the document scanner
+    # resumes across calls, so one pre-joined chunk is equivalent
+    SUPPORTS_BATCH = True
+
     def __init__(self, processor: AsyncBsonProcessor = None):
         """Initialize the async streaming JSON parser."""
         self._state = AsyncParserState()
         self._processor = processor or AsyncBsonProcessor()
 
-    def consume(self, buffer: str) -> None:
-        """Process a chunk of JSON data incrementally."""
-        anyio.run(self._consume_async, buffer)
+    def consume(self, buffer: Union[str, bytes]) -> None:
+        """Process a chunk of JSON data incrementally.
+
+        Text chunks are UTF-8 encoded and bytes appended as they are, so the
+        buffer grows in place. Parsing is CPU-bound, so it runs on the calling
+        thread instead of starting an event loop per chunk.
+        """
+        self._state.buffer += buffer.encode('utf-8') if isinstance(buffer, str) else buffer
+        self._state.parsed_data.update(self._processor._process_state_sync(self._state))
 
     def get(self) -> Dict[str, Any]:
         """Return current parsed state as a Python object."""
-        return anyio.run(self._get_async)
-
-    async def _consume_async(self, buffer: str) -> None:
-        """Async process a chunk of JSON data incrementally."""
-        self._state.buffer += buffer
-        new_data = await self._processor.process_buffer(self._state.buffer)
-        if new_data:
-            self._state.parsed_data.update(new_data)
-
-    async def _get_async(self) -> Dict[str, Any]:
-        """Async return current parsed state as a Python object."""
-        return {k: self._state.parsed_data[k] for k in sorted(self._state.parsed_data.keys())}
+        return self._state.parsed_data.copy()
 
 
 def check_solution(tests=None):
@@ -7,6 +7,7 @@ streaming JSON parser adhering to the project-wide specification.
 The original async helper classes remain but are no longer used by the refactored StreamingJsonParser.
 """
 import json
+import re
 import anyio # Retained for context, but not used by the refactored parser
 from dataclasses import dataclass, field
 from typing import Any, Dict, Optional, List
@@ -337,6 +338,13 @@ class StreamingJsonParser:
 # --- End of Refactored StreamingJsonParser ---
 
 # --- Original Async Pickle-inspired helper classes (now unused by StreamingJsonParser) ---
+# Text shorter than this is scanned on the event loop: the scan takes less
+# time than handing it to a worker thread and waking back up.
+_INLINE_MAX_CHARS = 8192
+# Document splitter tokens: a whole string literal (its closing quote may not
+# have arrived yet), a brace, or a backslash with the character it escapes.
+_DOC_TOKEN = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"?|[{}]|\\.?', re.DOTALL)
+
 @dataclass
 class AsyncParserState: # Original class
     """Immutable state container for async Pickle parser."""
@@ -344,12 +352,12 @@ class AsyncParserState: # Original class
     parsed_data: Dict[str, Any] = field(default_factory=dict)
 
 class AsyncPickleValidator: # Original class
-    """Async validator for Pickle-style documents."""
+    """Validator for Pickle-style documents."""
     @staticmethod
-    async def is_valid_key(key: Any) -> bool:
+    def is_valid_key(key: Any) -> bool:
         return isinstance(key, str) and len(key) > 0
     @staticmethod
-    async def is_valid_value(value: Any) -> bool:
+    def is_valid_value(value: Any) -> bool:
         if value is None or isinstance(value, (str, int, float, bool)):
             return True
         if isinstance(value, (list, dict)):
@@ -357,20 +365,15 @@ class AsyncPickleValidator: # Original class
         return False
 
 class AsyncPickleExtractor: # Original class
-    """Async extractor for complete key-value pairs."""
+    """Extractor for complete key-value pairs; the checks are too cheap to schedule as tasks."""
     @staticmethod
-    async def extract_complete_pairs(obj: Dict[str, Any]) -> Dict[str, Any]:
+    def extract_complete_pairs(obj: Dict[str, Any]) -> Dict[str, Any]:
         if not isinstance(obj, dict):
             return {}
-        result = {}
-        async with anyio.create_task_group() as tg:
-            for key, value in obj.items():
-                tg.start_soon(AsyncPickleExtractor._process_pair, key, value, result)
-        return result
-    @staticmethod
-    async def _process_pair(key: str, value: Any, result: Dict[str, Any]) -> None:
-        if await AsyncPickleValidator.is_valid_key(key) and await AsyncPickleValidator.is_valid_value(value):
-            result[key] = value
+        return {
+            key: value for key, value in obj.items()
+            if AsyncPickleValidator.is_valid_key(key) and AsyncPickleValidator.is_valid_value(value)
+        }
 
 class AsyncPickleParser: # Original class
     """Async parser for individual Pickle-style documents."""
@@ -379,11 +382,11 @@ class AsyncPickleParser: # Original class
     async def parse_document(self, doc_str: str) -> Dict[str, Any]:
         parsed_obj = await self._try_direct_parse_async(doc_str)
         if parsed_obj:
-            return await self._extractor.extract_complete_pairs(parsed_obj)
+            return self._extractor.extract_complete_pairs(parsed_obj)
         return await self._try_partial_parse_async(doc_str)
     async def _try_direct_parse_async(self, doc_str: str) -> Optional[Dict[str, Any]]:
         try:
-            obj = await anyio.to_thread.run_sync(json.loads, doc_str)
+            obj = json.loads(doc_str)
             return obj if isinstance(obj, dict) else None
         except json.JSONDecodeError:
             return None
@@ -392,9 +395,9 @@ class AsyncPickleParser: # Original class
         if not balanced_doc:
             return {}
         try:
-            obj = await anyio.to_thread.run_sync(json.loads, balanced_doc)
+            obj = json.loads(balanced_doc)
             if isinstance(obj, dict):
-                return await self._extractor.extract_complete_pairs(obj)
+                return self._extractor.extract_complete_pairs(obj)
         except json.JSONDecodeError:
             pass
         return {}
@@ -415,46 +418,37 @@ class AsyncPickleProcessor: # Original class
     def __init__(self, parser: AsyncPickleParser = None):
         self._parser = parser or AsyncPickleParser()
     async def process_buffer(self, buffer: str) -> Dict[str, Any]:
+        # Documents are parsed in order, so later documents win on repeated keys.
         documents = await self._extract_documents_async(buffer)
         parsed_data = {}
-        async with anyio.create_task_group() as tg:
-            for doc in documents:
-                tg.start_soon(self._process_document, doc, parsed_data)
+        for doc in documents:
+            parsed_data.update(await self._parser.parse_document(doc))
         return parsed_data
     async def _extract_documents_async(self, text: str) -> List[str]:
+        if len(text) < _INLINE_MAX_CHARS:
+            return self._extract_documents_sync(text)
         return await anyio.to_thread.run_sync(self._extract_documents_sync, text)
     @staticmethod
     def _extract_documents_sync(text: str) -> List[str]:
+        # Documents are sliced out of text by index when their braces close.
+        # Only braces matter, so string literals and escapes are skipped as
+        # whole tokens inside the regex engine.
         documents = []
-        current_doc = ""
+        doc_start = 0
         brace_count = 0
-        in_string = False
-        escape_next = False
-        for char in text:
-            current_doc += char
-            if escape_next:
-                escape_next = False
-                continue
-            if char == '\\':
-                escape_next = True
-                continue
-            if char == '"' and not escape_next:
-                in_string = not in_string
-                continue
-            if not in_string:
-                if char == '{':
-                    brace_count += 1
-                elif char == '}':
-                    brace_count -= 1
-                    if brace_count == 0 and current_doc.strip():
-                        documents.append(current_doc.strip())
-                        current_doc = ""
-        if current_doc.strip() and brace_count > 0:
-            documents.append(current_doc.strip())
+        for match in _DOC_TOKEN.finditer(text):
+            token = match.group()
+            if token == '{':
+                brace_count += 1
+            elif token == '}':
+                brace_count -= 1
+                if brace_count == 0:
+                    documents.append(text[doc_start:match.end()].strip())
+                    doc_start = match.end()
+        trailing_doc = text[doc_start:].strip()
+        if trailing_doc and brace_count > 0:
+            documents.append(trailing_doc)
         return documents
-    async def _process_document(self, doc: str, parsed_data: Dict[str, Any]) -> None:
-        doc_data = await self._parser.parse_document(doc)
-        parsed_data.update(doc_data)
 
 def get_metadata():
     """Returns metadata for the anyio Pickle parser."""
@@ -7,6 +7,7 @@ streaming JSON parser adhering to the project-wide specification.
 The original async helper classes remain but are no longer used by the refactored StreamingJsonParser.
 """
 import json
+import re
 import anyio # Retained for context, but not used by the refactored parser
 from dataclasses import dataclass, field
 from typing import Any, Dict, Optional, List
@@ -331,6 +332,13 @@ class StreamingJsonParser:
 # --- End of Refactored StreamingJsonParser ---
 
 # --- Original Async Ultra-JSON-inspired helper classes (now unused by StreamingJsonParser) ---
+# Document splitter tokens: a whole string literal (its closing quote may not
+# have arrived yet), a brace, or a backslash with the character it escapes.
+_DOC_TOKEN = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"?|[{}]|\\.?', re.DOTALL)
+# Text shorter than this is scanned on the event loop: the scan takes less
+# time than handing it to a worker thread and waking back up.
+_INLINE_MAX_CHARS = 8192
+
 @dataclass
 class AsyncParserState: # Original class
     """Immutable state container for async Ultra-JSON parser."""
@@ -378,7 +386,7 @@ class AsyncUltraJsonParser: # Original class
     @staticmethod
     async def _try_direct_parse_async(doc_str: str) -> Optional[Dict[str, Any]]:
         try:
-            obj = await anyio.to_thread.run_sync(json.loads, doc_str)
+            obj = json.loads(doc_str)
             return obj if isinstance(obj, dict) else None
         except json.JSONDecodeError:
             return None
@@ -387,7 +395,7 @@ class AsyncUltraJsonParser: # Original class
         if not balanced_doc:
             return {}
         try:
-            obj = await anyio.to_thread.run_sync(json.loads, balanced_doc)
+            obj = json.loads(balanced_doc)
             if isinstance(obj, dict):
                 return await self._extractor.extract_complete_pairs(obj)
         except json.JSONDecodeError:
@@ -417,35 +425,29 @@ class AsyncUltraJsonProcessor: # Original class
                 tg.start_soon(self._process_document, doc, parsed_data)
         return parsed_data
     async def _extract_documents_async(self, text: str) -> List[str]:
+        if len(text) < _INLINE_MAX_CHARS:
+            return self._extract_documents_sync(text)
         return await anyio.to_thread.run_sync(self._extract_documents_sync, text)
     @staticmethod
     def _extract_documents_sync(text: str) -> List[str]:
+        # Documents are sliced out of text by index when their braces close.
+        # Only braces matter, so string literals and escapes are skipped as
+        # whole tokens inside the regex engine.
         documents = []
-        current_doc = ""
+        doc_start = 0
         brace_count = 0
-        in_string = False
-        escape_next = False
-        for char in text:
-            current_doc += char
-            if escape_next:
-                escape_next = False
-                continue
-            if char == '\\':
-                escape_next = True
-                continue
-            if char == '"' and not escape_next:
-                in_string = not in_string
-                continue
-            if not in_string:
-                if char == '{':
-                    brace_count += 1
-                elif char == '}':
-                    brace_count -= 1
-                    if brace_count == 0 and current_doc.strip():
-                        documents.append(current_doc.strip())
-                        current_doc = ""
-        if current_doc.strip() and brace_count > 0:
-            documents.append(current_doc.strip())
+        for match in _DOC_TOKEN.finditer(text):
+            token = match.group()
+            if token == '{':
+                brace_count += 1
+            elif token == '}':
+                brace_count -= 1
+                if brace_count == 0:
+                    documents.append(text[doc_start:match.end()].strip())
+                    doc_start = match.end()
+        trailing_doc = text[doc_start:].strip()
+        if trailing_doc and brace_count > 0:
+            documents.append(trailing_doc)
         return documents
     async def _process_document(self, doc: str, parsed_data: Dict[str, Any]) -> None:
         doc_data = await self._parser.parse_document(doc)
@@ -7,8 +7,10 @@ streaming JSON parser adhering to the project-wide specification.
 The original Ultra-JSON-inspired helper classes remain but are no longer used by StreamingJsonParser.
 """
 import json
+import re
+import sys
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 # --- Start of Refactored StreamingJsonParser and its dependencies ---
 # (Identical to the implementation in raw/ultrajson_parser.py for consistency and compliance)
@@ -30,9 +32,35 @@ _ST_EXPECT_COMMA_OR_OBJ_END = 12
 _ST_OBJ_END = 13
 _ST_ERROR = 99
 
-_WHITESPACE = b" \t\n\r"
+# Whitespace byte values; a frozenset hashes the int instead of scanning a bytes object.
+_WHITESPACE = frozenset(b" \t\n\r")
 _DIGITS = b"0123456789"
 _NUMBER_CHARS = _DIGITS + b"-.eE+"
+# Number-character lookup by byte value, an index instead of a scan of _NUMBER_CHARS.
+_IS_NUMBER_CHAR = bytes(1 if c in _NUMBER_CHARS else 0 for c in range(256))
+# A run of number characters, matched in C up to the first terminator. Group 1
+# takes part once a '.', 'e' or 'E' appears, so the match also says whether
+# the number is a float.
+_NUMBER_RUN = re.compile(rb'[0-9+\-]*([.eE][0-9.eE+\-]*)?')
+# A number ending in one of these bytes is incomplete.
+_INCOMPLETE_NUMBER_ENDS = frozenset(b".eE+-")
+# Byte each escaped byte stands for, indexed by the byte after the backslash.
+# '"', '\\' and '/' stand for themselves, as do bytes with no single-character escape.
+_ESCAPE_LUT = bytes.maketrans(b"bfnrt", b"\b\f\n\r\t")
+
+
+def _scan_string_body(buf: bytearray, start: int, end: int) -> int:
+    """
+    Returns the index of the first '"' or '\\' in buf[start:end], or end if there is none.
+
+    Both searches run at memchr speed; the backslash search stops at the quote,
+    so neither scans past the end of the string.
+    """
+    quote = buf.find(b'"', start, end)
+    if quote < 0:
+        quote = end
+    backslash = buf.find(b'\\', start, quote)
+    return quote if backslash < 0 else backslash
 
 class StreamingJsonParser:
     """
@@ -52,7 +80,42 @@ class StreamingJsonParser:
         self._current_value_bytes = bytearray()
         
         self._active_key: Optional[str] = None # Stores the decoded string of the last fully parsed key
+        self._cur_num_is_float = False # Set once the number being scanned has a '.', 'e' or 'E'
         self._idx = 0 # Current parsing index within self._buffer
+        self._doc_keys: List[str] = [] # Keys of the current document, in order
+        self._last_keys: List[str] = [] # Keys of the last completed document
+        # Keys shared by two consecutive documents, which predict the next
+        # document's keys, and their quoted byte form (None where a key needs escapes).
+        self._schema_keys: List[str] = []
+        self._schema_quoted: List[Optional[bytes]] = []
+
+    def reset(self) -> None:
+        """
+        Clears all parsing state in place so the instance can parse a new document.
+
+        Once two consecutive completed documents have the same keys in the same
+        order, those keys are expected in the next document.
+        """
+        doc_keys = self._doc_keys
+        if self._state == _ST_OBJ_END and doc_keys:
+            if doc_keys == self._last_keys and doc_keys != self._schema_keys:
+                self._schema_keys = doc_keys
+                self._schema_quoted = [
+                    None if '"' in key or '\\' in key else b'"' + key.encode('utf-8') + b'"'
+                    for key in doc_keys
+                ]
+            self._last_keys = doc_keys
+            self._doc_keys = []
+        else:
+            self._doc_keys.clear()
+        self._buffer.clear()
+        self._result.clear()
+        self._state = _ST_EXPECT_OBJ_START
+        self._current_key_bytes.clear()
+        self._current_value_bytes.clear()
+        self._active_key = None
+        self._cur_num_is_float = False
+        self._idx = 0
 
     def consume(self, buffer: str) -> None:
         """
@@ -64,7 +127,15 @@ class StreamingJsonParser:
         if not isinstance(buffer, str):
             return # Ignore invalid chunk types gracefully
         # Convert string to bytes for internal processing
-        chunk = buffer.encode('utf-8')
+        self.consume_bytes(buffer.encode('utf-8'))
+
+    def consume_bytes(self, chunk: bytes) -> None:
+        """
+        Consumes a chunk of UTF-8 encoded JSON data without re-encoding it.
+
+        Args:
+            chunk: Bytes containing a part of the JSON document.
+        """
         self._buffer.extend(chunk)
         self._process_buffer()
 
@@ -91,15 +162,7 @@ class StreamingJsonParser:
 
     def _handle_escape_char(self, byte_val: int) -> int:
         """Handles JSON escape sequences."""
-        if byte_val == b'"'[0]: return b'"'[0]
-        if byte_val == b'\\'[0]: return b'\\'[0]
-        if byte_val == b'/'[0]: return b'/'[0]
-        if byte_val == b'b'[0]: return b'\b'[0]
-        if byte_val == b'f'[0]: return b'\f'[0]
-        if byte_val == b'n'[0]: return b'\n'[0]
-        if byte_val == b'r'[0]: return b'\r'[0]
-        if byte_val == b't'[0]: return b'\t'[0]
-        return byte_val
+        return _ESCAPE_LUT[byte_val]
 
     def _finalize_value(self, value: Any):
         """Helper to assign a parsed value to the active key and reset."""
@@ -107,139 +170,191 @@ class StreamingJsonParser:
             self._result[self._active_key] = value
         self._active_key = None
         self._current_value_bytes.clear()
+        self._cur_num_is_float = False
         self._state = _ST_EXPECT_COMMA_OR_OBJ_END
         
     def _parse_and_finalize_number(self):
-        """Parses the number in _current_value_bytes and finalizes it."""
-        if not self._current_value_bytes:
-            self._state = _ST_ERROR; return False
-
-        num_str = self._current_value_bytes.decode('utf-8') 
+        """
+        Parses the number in _current_value_bytes and finalizes it.
 
-        if num_str == "-" or num_str == "+" or num_str.endswith(('.', 'e', 'E', '+', '-')):
+        Whether the number is a float was recorded while its bytes were
+        scanned, so it is converted straight from the bytes with no second pass.
+        """
+        num_bytes = self._current_value_bytes
+        if not num_bytes or num_bytes[-1] in _INCOMPLETE_NUMBER_ENDS:
             self._state = _ST_ERROR; return False
 
         try:
-            if any(c in num_str for c in ('.', 'e', 'E')):
-                parsed_num = float(num_str)
-            else:
-                parsed_num = int(num_str)
+            parsed_num = float(num_bytes) if self._cur_num_is_float else int(num_bytes)
             self._finalize_value(parsed_num)
             return True
-        except ValueError: 
+        except ValueError:
             self._state = _ST_ERROR; return False
 
     def _process_buffer(self):
-        """Processes the internal buffer to parse JSON content using a state machine."""
-        buffer_len = len(self._buffer)
-        while self._idx < buffer_len:
-            byte = self._buffer[self._idx]
-
-            if self._state == _ST_EXPECT_OBJ_START:
-                if byte in _WHITESPACE: self._idx += 1; continue
-                if byte == b'{'[0]: self._state = _ST_EXPECT_KEY_START; self._idx += 1
-                else: self._state = _ST_ERROR; return 
-            
-            elif self._state == _ST_EXPECT_KEY_START:
-                if byte in _WHITESPACE: self._idx += 1; continue
-                if byte == b'"'[0]:
-                    self._state = _ST_IN_KEY
-                    self._current_key_bytes.clear()
-                    self._active_key = None 
-                    self._idx += 1
-                elif byte == b'}'[0]: self._state = _ST_OBJ_END; self._idx += 1
-                else: self._state = _ST_ERROR; return 
-
-            elif self._state == _ST_IN_KEY:
-                if byte == b'\\'[0]: self._state = _ST_IN_KEY_ESCAPE; self._idx += 1
+        """
+        Processes the internal buffer to parse JSON content using a state machine.
+
+        The buffer, index, state and byte accumulators are held in locals for
+        the whole loop, so each byte costs local loads instead of attribute
+        lookups; state and index are stored back when the loop exits. States
+        are tested roughly in order of how many bytes they consume.
+        """
+        buf = self._buffer
+        key_bytes = self._current_key_bytes
+        doc_keys = self._doc_keys
+        schema_keys = self._schema_keys
+        schema_quoted = self._schema_quoted
+        value_bytes = self._current_value_bytes
+        state = self._state
+        idx = self._idx
+        buffer_len = len(buf)
+        while idx < buffer_len:
+            byte = buf[idx]
+
+            if state == _ST_IN_STRING_VALUE:
+                if byte == b'\\'[0]: state = _ST_IN_STRING_VALUE_ESCAPE; idx += 1
                 elif byte == b'"'[0]:
+                    if self._active_key is None:
+                        state = _ST_ERROR; break
                     try:
-                        self._active_key = self._current_key_bytes.decode('utf-8')
-                        self._state = _ST_EXPECT_COLON
+                        value_str = value_bytes.decode('utf-8')
                     except UnicodeDecodeError:
-                        self._active_key = None; self._state = _ST_ERROR; return 
-                    self._idx += 1
-                else: self._current_key_bytes.append(byte); self._idx += 1
-            
-            elif self._state == _ST_IN_KEY_ESCAPE:
-                self._current_key_bytes.append(self._handle_escape_char(byte))
-                self._state = _ST_IN_KEY; self._idx += 1
-
-            elif self._state == _ST_EXPECT_COLON:
-                if byte in _WHITESPACE: self._idx += 1; continue
-                if byte == b':'[0]: self._state = _ST_EXPECT_VALUE_START; self._idx += 1
-                else: self._state = _ST_ERROR; return 
-
-            elif self._state == _ST_EXPECT_VALUE_START:
-                if byte in _WHITESPACE: self._idx += 1; continue
-                self._current_value_bytes.clear()
-                if byte == b'"'[0]: self._state = _ST_IN_STRING_VALUE; self._idx += 1
-                elif byte == b't'[0]: self._state = _ST_IN_TRUE; self._current_value_bytes.append(byte); self._idx += 1
-                elif byte == b'f'[0]: self._state = _ST_IN_FALSE; self._current_value_bytes.append(byte); self._idx += 1
-                elif byte == b'n'[0]: self._state = _ST_IN_NULL; self._current_value_bytes.append(byte); self._idx += 1
-                elif byte in _NUMBER_CHARS and (byte != b'+'[0]): 
-                    self._state = _ST_IN_NUMBER; self._current_value_bytes.append(byte); self._idx += 1
-                else: self._state = _ST_ERROR; return 
-
-            elif self._state == _ST_IN_STRING_VALUE:
-                if byte == b'\\'[0]: self._state = _ST_IN_STRING_VALUE_ESCAPE; self._idx += 1
+                        value_str = value_bytes.decode('utf-8', errors='replace')
+                    self._finalize_value(value_str)
+                    state = _ST_EXPECT_COMMA_OR_OBJ_END; idx += 1
+                else:
+                    # Copy the run up to the next delimiter in one slice.
+                    body_end = _scan_string_body(buf, idx, buffer_len)
+                    value_bytes += buf[idx:body_end]
+                    idx = body_end
+
+            elif state == _ST_IN_KEY:
+                if byte == b'\\'[0]: state = _ST_IN_KEY_ESCAPE; idx += 1
                 elif byte == b'"'[0]:
-                    if self._active_key is not None:
+                    try:
+                        self._active_key = sys.intern(key_bytes.decode('utf-8'))
+                    except UnicodeDecodeError:
+                        self._active_key = None; state = _ST_ERROR; break
+                    doc_keys.append(self._active_key)
+                    state = _ST_EXPECT_COLON; idx += 1
+                else:
+                    body_end = _scan_string_body(buf, idx, buffer_len)
+                    if not key_bytes and body_end < buffer_len and buf[body_end] == b'"'[0]:
+                        # The whole key is buffered and has no escapes, so it is
+                        # decoded from its slice without going through key_bytes.
                         try:
-                            value_str = self._current_value_bytes.decode('utf-8')
-                            self._finalize_value(value_str)
-                        except UnicodeDecodeError: 
-                            value_str = self._current_value_bytes.decode('utf-8', errors='replace')
-                            self._finalize_value(value_str)
-                    else: 
-                        self._state = _ST_ERROR; return
-                    self._idx += 1
-                else: self._current_value_bytes.append(byte); self._idx += 1
-
-            elif self._state == _ST_IN_STRING_VALUE_ESCAPE:
-                self._current_value_bytes.append(self._handle_escape_char(byte))
-                self._state = _ST_IN_STRING_VALUE; self._idx += 1
-            
-            elif self._state == _ST_IN_TRUE:
-                self._current_value_bytes.append(byte); self._idx += 1
-                if self._current_value_bytes == b"true": self._finalize_value(True)
-                elif not b"true".startswith(self._current_value_bytes): self._state = _ST_ERROR; return
-            
-            elif self._state == _ST_IN_FALSE:
-                self._current_value_bytes.append(byte); self._idx += 1
-                if self._current_value_bytes == b"false": self._finalize_value(False)
-                elif not b"false".startswith(self._current_value_bytes): self._state = _ST_ERROR; return
-
-            elif self._state == _ST_IN_NULL:
-                self._current_value_bytes.append(byte); self._idx += 1
-                if self._current_value_bytes == b"null": self._finalize_value(None)
-                elif not b"null".startswith(self._current_value_bytes): self._state = _ST_ERROR; return
-            
-            elif self._state == _ST_IN_NUMBER:
-                if byte in _NUMBER_CHARS: 
-                    self._current_value_bytes.append(byte); self._idx += 1
-                else: 
-                    if not self._parse_and_finalize_number(): return 
-            
-            elif self._state == _ST_EXPECT_COMMA_OR_OBJ_END:
-                if byte in _WHITESPACE: self._idx += 1; continue
-                if byte == b','[0]: self._state = _ST_EXPECT_KEY_START; self._idx += 1
-                elif byte == b'}'[0]: self._state = _ST_OBJ_END; self._idx += 1
-                else: self._state = _ST_ERROR; return 
-
-            elif self._state == _ST_OBJ_END:
-                if byte in _WHITESPACE: self._idx += 1; continue 
-                self._state = _ST_ERROR; return 
-
-            elif self._state == _ST_ERROR:
-                return 
-
-            else: 
-                self._state = _ST_ERROR; return
-        
-        if self._idx > 0:
-            self._buffer = self._buffer[self._idx:]
-            self._idx = 0
+                            self._active_key = sys.intern(buf[idx:body_end].decode('utf-8'))
+                        except UnicodeDecodeError:
+                            self._active_key = None; state = _ST_ERROR; break
+                        doc_keys.append(self._active_key)
+                        state = _ST_EXPECT_COLON; idx = body_end + 1
+                    else:
+                        key_bytes += buf[idx:body_end]
+                        idx = body_end
+
+            elif state == _ST_IN_NUMBER:
+                run = _NUMBER_RUN.match(buf, idx)
+                if run.lastindex:
+                    self._cur_num_is_float = True
+                run_end = run.end()
+                value_bytes += buf[idx:run_end]
+                idx = run_end
+                if idx < buffer_len:
+                    # The terminating byte is not consumed; it is read again
+                    # in the state the number leaves behind.
+                    self._parse_and_finalize_number()
+                    state = self._state
+                    if state == _ST_ERROR: break
+
+            elif state == _ST_EXPECT_KEY_START:
+                if byte in _WHITESPACE: idx += 1; continue
+                if byte == b'"'[0]:
+                    key_pos = len(doc_keys)
+                    if key_pos < len(schema_keys):
+                        # A key matching the previous document's key at this
+                        # position, quotes included, is taken without scanning it.
+                        quoted = schema_quoted[key_pos]
+                        if quoted is not None and buf.startswith(quoted, idx):
+                            self._active_key = schema_keys[key_pos]
+                            doc_keys.append(self._active_key)
+                            state = _ST_EXPECT_COLON; idx += len(quoted)
+                            continue
+                    state = _ST_IN_KEY
+                    key_bytes.clear()
+                    self._active_key = None
+                    idx += 1
+                elif byte == b'}'[0]: state = _ST_OBJ_END; idx += 1
+                else: state = _ST_ERROR; break
+
+            elif state == _ST_EXPECT_COLON:
+                if byte in _WHITESPACE: idx += 1; continue
+                if byte == b':'[0]: state = _ST_EXPECT_VALUE_START; idx += 1
+                else: state = _ST_ERROR; break
+
+            elif state == _ST_EXPECT_VALUE_START:
+                if byte in _WHITESPACE: idx += 1; continue
+                value_bytes.clear()
+                if byte == b'"'[0]: state = _ST_IN_STRING_VALUE; idx += 1
+                elif byte == b't'[0]: state = _ST_IN_TRUE; value_bytes.append(byte); idx += 1
+                elif byte == b'f'[0]: state = _ST_IN_FALSE; value_bytes.append(byte); idx += 1
+                elif byte == b'n'[0]: state = _ST_IN_NULL; value_bytes.append(byte); idx += 1
+                elif _IS_NUMBER_CHAR[byte] and (byte != b'+'[0]):
+                    # The number state scans the run from its first byte.
+                    state = _ST_IN_NUMBER
+                else: state = _ST_ERROR; break
+
+            elif state == _ST_EXPECT_COMMA_OR_OBJ_END:
+                if byte in _WHITESPACE: idx += 1; continue
+                if byte == b','[0]: state = _ST_EXPECT_KEY_START; idx += 1
+                elif byte == b'}'[0]: state = _ST_OBJ_END; idx += 1
+                else: state = _ST_ERROR; break
+
+            elif state == _ST_IN_STRING_VALUE_ESCAPE:
+                value_bytes.append(_ESCAPE_LUT[byte])
+                state = _ST_IN_STRING_VALUE; idx += 1
+
+            elif state == _ST_IN_KEY_ESCAPE:
+                key_bytes.append(_ESCAPE_LUT[byte])
+                state = _ST_IN_KEY; idx += 1
+
+            elif state == _ST_IN_TRUE:
+                value_bytes.append(byte); idx += 1
+                if value_bytes == b"true": self._finalize_value(True); state = _ST_EXPECT_COMMA_OR_OBJ_END
+                elif not b"true".startswith(value_bytes): state = _ST_ERROR; break
+
+            elif state == _ST_IN_FALSE:
+                value_bytes.append(byte); idx += 1
+                if value_bytes == b"false": self._finalize_value(False); state = _ST_EXPECT_COMMA_OR_OBJ_END
+                elif not b"false".startswith(value_bytes): state = _ST_ERROR; break
+
+            elif state == _ST_IN_NULL:
+                value_bytes.append(byte); idx += 1
+                if value_bytes == b"null": self._finalize_value(None); state = _ST_EXPECT_COMMA_OR_OBJ_END
+                elif not b"null".startswith(value_bytes): state = _ST_ERROR; break
+
+            elif state == _ST_EXPECT_OBJ_START:
+                if byte in _WHITESPACE: idx += 1; continue
+                if byte == b'{'[0]: state = _ST_EXPECT_KEY_START; idx += 1
+                else: state = _ST_ERROR; break
+
+            elif state == _ST_OBJ_END:
+                if byte in _WHITESPACE: idx += 1; continue
+                state = _ST_ERROR; break
+
+            else:
+                # _ST_ERROR is terminal.
+                state = _ST_ERROR; break
+
+        self._state = state
+        if state == _ST_ERROR:
+            # Nothing is parsed after an error, so the input is not kept.
+            buf.clear()
+        else:
+            # Parsed bytes are dropped in place; deleting from the front of a
+            # bytearray only moves its start, so the buffer is never copied.
+            del buf[:idx]
+        self._idx = 0
 
 # --- End of Refactored StreamingJsonParser ---
 
@@ -596,10 +711,18 @@ def test_partial_streaming_json_parser():
     parser.consume('{"foo": "bar')
     assert parser.get() == {"foo": "bar"}
 
+def test_reset_streaming_json_parser():
+    parser = StreamingJsonParser()
+    parser.consume('{"foo": "ba')
+    parser.reset()
+    parser.consume('{"baz": 1}')
+    assert parser.get() == {"baz": 1}
+
 if __name__ == '__main__':
     test_streaming_json_parser()
     test_chunked_streaming_json_parser()
     test_partial_streaming_json_parser()
+    test_reset_streaming_json_parser()
     print("Refactored StreamingJsonParser tests passed successfully!")
 
 
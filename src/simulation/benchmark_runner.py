@@ -8,6 +8,7 @@ metrics including performance, throughput, CPU usage, and network simulation.
 """
 
 import argparse
+import heapq
 import json
 import multiprocessing
 import sys
@@ -301,7 +302,7 @@ class BenchmarkResultsManager:
             f"Success Rate: {len(ok)}/{len(self.results)} ({len(ok)/len(self.results)*100:.1f}%)"
         )
 
-        top = sorted(ok, key=lambda x: x.get("throughput_mbps", 0), reverse=True)[:5]
+        top = heapq.nlargest(5, ok, key=lambda x: x.get("throughput_mbps", 0))
         print("\nTop 5 Performers (Throughput):")
         for i, r in enumerate(top, 1):
             print(
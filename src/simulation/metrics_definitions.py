@@ -7,6 +7,9 @@ class PerformanceCategory:
     metric_key: str
     display_name: str
     lower_is_better: bool = True
+    # Boolean result column that must be true for every row before the
+    # category is ranked; None ranks it unconditionally.
+    required_flag: Optional[str] = None
 
 class PerformanceCategoryManager:
     """Manages performance categories for analysis."""
@@ -16,7 +19,9 @@ class PerformanceCategoryManager:
             PerformanceCategory('serialize_time_ms', 'Serialization Speed', True),
             PerformanceCategory('deserialize_time_ms', 'Deserialization Speed', True),
             PerformanceCategory('throughput_mbps', 'Throughput (MB/s)', False),
-            PerformanceCategory('memory_peak_bytes', 'Memory Efficiency', True),
+            # OS-sampled RSS deltas are mostly 0 on small datasets, so memory is
+            # only ranked when it was traced with --deep-memory-profile.
+            PerformanceCategory('memory_peak_bytes', 'Memory Efficiency', True, 'memory_traced'),
             PerformanceCategory('cpu_time_seconds', 'CPU Efficiency', True),
             PerformanceCategory('dataset_size', 'Data Size', True),
             PerformanceCategory('total_ser_deser_time_ms', 'Total Processing Time', True)
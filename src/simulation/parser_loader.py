@@ -2,33 +2,78 @@
 
 import importlib
 import pkgutil
+import sys
 import traceback
-from typing import Dict, Type
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Dict, Iterator, Optional, Type
 
-LOADED_PARSERS: Dict[str, Type] = {}
-FAILED_PARSERS: Dict[str, str] = {}
+_LOADED_PARSERS: Dict[str, Type] = {}
+_FAILED_PARSERS: Dict[str, str] = {}
+# Base package of the last completed discovery, so repeat calls are no-ops.
+_discovered_package: Optional[str] = None
+
+
+def _cached_import(name: str) -> ModuleType:
+    """Return an already-imported module from sys.modules, importing it otherwise."""
+    module = sys.modules.get(name)
+    return module if module is not None else importlib.import_module(name)
+
+
+def _iter_module_names(base_package: str) -> Iterator[str]:
+    """Yield dotted names of the modules and sub-packages under base_package.
+
+    The package directory is walked with pathlib, so nothing is imported
+    while listing; names come out in pkgutil.walk_packages order. Packages
+    that are not plain directories (zipped or frozen) fall back to pkgutil.
+    """
+    root = Path(base_package.replace(".", "/"))
+    if not root.is_dir():
+        for _finder, name, _ispkg in pkgutil.walk_packages([str(root)], base_package + "."):
+            yield name
+        return
+
+    module_parts = []
+    for path in root.rglob("*.py"):
+        parts = path.relative_to(root).with_suffix("").parts
+        if parts[-1] == "__init__":
+            parts = parts[:-1]
+        if parts:
+            module_parts.append(parts)
+    for parts in sorted(module_parts):
+        yield ".".join((base_package,) + parts)
 
 
 def discover_parsers(base_package: str = "serializers") -> None:
     """Discovers and loads all parsers from the specified base package."""
-    global LOADED_PARSERS, FAILED_PARSERS
-    LOADED_PARSERS.clear()
-    FAILED_PARSERS.clear()
+    global _discovered_package
+    if _LOADED_PARSERS and _discovered_package == base_package:
+        return
+    _LOADED_PARSERS.clear()
+    _FAILED_PARSERS.clear()
 
-    for finder, name, ispkg in pkgutil.walk_packages(
-        [base_package.replace(".", "/")], base_package + "."
-    ):
+    for name in _iter_module_names(base_package):
         try:
-            module = importlib.import_module(name)
+            module = _cached_import(name)
             parser_cls = getattr(module, "StreamingJsonParser", None)
             if parser_cls:
-                LOADED_PARSERS[name] = parser_cls
+                _LOADED_PARSERS[name] = parser_cls
                 print(f"✓ Loaded parser: {name}")
         except Exception as e:
-            FAILED_PARSERS[name] = str(e)
+            _FAILED_PARSERS[name] = str(e)
             print(f"❌ Failed to load parser: {name} - {e}")
             traceback.print_exc()
+    _discovered_package = base_package
 
 
-# Discover parsers at import time
-discover_parsers()
+def __getattr__(name: str) -> Any:
+    """Discover parsers on first access to LOADED_PARSERS/FAILED_PARSERS."""
+    if name == "LOADED_PARSERS":
+        if _discovered_package is None:
+            discover_parsers()
+        return _LOADED_PARSERS
+    if name == "FAILED_PARSERS":
+        if _discovered_package is None:
+            discover_parsers()
+        return _FAILED_PARSERS
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
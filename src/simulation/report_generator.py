@@ -74,6 +74,10 @@ class StatisticsCalculator:
         for category in category_manager.get_categories():
             if category.metric_key not in df.columns:
                 continue
+            if category.required_flag is not None and not (
+                category.required_flag in df.columns and df[category.required_flag].astype(bool).all()
+            ):
+                continue
 
             # Calculate statistics per algorithm
             stats = df.groupby(algorithm_col)[category.metric_key].agg([
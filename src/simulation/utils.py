@@ -17,6 +17,11 @@ from typing import Dict, List, Any, Union, Tuple, Sequence, TypeVar
 # Fix for protected member access - use public interface
 from tqdm import tqdm
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
 # Properly declare the TypeVar in __all__
 _T = TypeVar('_T')
 __all__ = ['Timer', 'calculate_throughput', 'calculate_amdahl_speedup', 'calculate_statistics',
@@ -253,7 +258,10 @@ def _save_results_json(results: List[Dict[str, Any]], fp: Path) -> None:
         },
         "results": results,
     }
-    fp.write_text(json.dumps(payload, indent=2, default=str), encoding="utf-8")
+    if orjson is not None:
+        fp.write_bytes(orjson.dumps(payload, default=str, option=orjson.OPT_INDENT_2))
+    else:
+        fp.write_text(json.dumps(payload, indent=2, default=str), encoding="utf-8")
 
 
 def create_progress_bar(total: int, desc: str = "Progress") -> tqdm[_T] | _SimpleProgressBar:
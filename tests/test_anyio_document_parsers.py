@@ -0,0 +1,215 @@
+"""
+Streaming behaviour of the anyio document parsers.
+"""
+
+import importlib
+import json
+
+import anyio
+import pytest
+
+from src.serializers.anyio.bson_parser import AsyncDocumentValidator, AsyncPairExtractor
+from src.serializers.anyio.pickle_parser import AsyncPickleProcessor
+from src.serializers.anyio.ultrajson_parser import AsyncUltraJsonProcessor
+from src.simulation.data_gen import create_streaming_chunks, generate_test_data
+
+PARSER_MODULES = [
+    "src.serializers.anyio.bson_parser",
+    "src.serializers.anyio.cbor_parser",
+]
+# Parsers sharing the buffered document splitter, without partial-field recovery.
+STREAMING_MODULES = PARSER_MODULES + [
+    "src.serializers.anyio.flatbuffers_parser",
+    "src.serializers.anyio.msgpack_parser",
+    "src.serializers.anyio.orjson_parser",
+]
+
+
+def _module_id(module_name):
+    return module_name.rsplit(".", 1)[-1].replace("_parser", "")
+
+
+@pytest.fixture(params=PARSER_MODULES, ids=_module_id)
+def parser(request):
+    """
+    Fixture to import StreamingJsonParser from each module in turn.
+    """
+    mod = importlib.import_module(request.param)
+    return mod.StreamingJsonParser()
+
+
+@pytest.fixture(params=STREAMING_MODULES, ids=_module_id)
+def streaming_parser(request):
+    """
+    Fixture to import StreamingJsonParser from every buffered anyio module.
+    """
+    mod = importlib.import_module(request.param)
+    return mod.StreamingJsonParser()
+
+
+def test_completed_documents_leave_the_buffer(streaming_parser):
+    """
+    Only the document still being streamed should stay buffered.
+    """
+    stream = "".join(json.dumps({f"key{i}": f"value{i}"}) for i in range(50))
+    longest = max(len(json.dumps({f"key{i}": f"value{i}"})) for i in range(50))
+    for char in stream:
+        streaming_parser.consume(char)
+        assert len(streaming_parser._state.buffer) <= longest
+    assert streaming_parser.get() == {f"key{i}": f"value{i}" for i in range(50)}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7])
+def test_escapes_split_across_chunks(streaming_parser, chunk_size):
+    """
+    Escaped quotes, backslashes and braces inside strings must survive any split.
+    """
+    data = {"a": 'q"{x}', "b": "c:\\dir\\", "c": {"d": "}\\\""}}
+    json_str = json.dumps(data)
+    for i in range(0, len(json_str), chunk_size):
+        streaming_parser.consume(json_str[i:i + chunk_size])
+    assert streaming_parser.get() == data
+
+
+def test_open_document_closes_only_unquoted_braces(streaming_parser):
+    """
+    Braces inside strings must not count towards closing an open document.
+    """
+    streaming_parser.consume('{"a": "x}", "b": {"c": "{{"}, "d": 1')
+    assert streaming_parser.get() == {"a": "x}", "b": {"c": "{{"}, "d": 1}
+
+
+def test_batched_consume_matches_per_chunk_consumes(streaming_parser):
+    """
+    Parsers declaring SUPPORTS_BATCH give the same result for one joined buffer
+    as for the benchmark's bytes chunks consumed one by one.
+    """
+    assert streaming_parser.SUPPORTS_BATCH
+    payload = json.dumps(generate_test_data(50)).encode("utf-8")
+    chunks = create_streaming_chunks(payload, 37)
+    for chunk in chunks:
+        streaming_parser.consume(chunk)
+    batched = type(streaming_parser)()
+    batched.consume(b"".join(chunks))
+    assert batched.get() == streaming_parser.get() == json.loads(payload)
+
+
+def test_partial_string_with_escapes(parser):
+    """
+    Partial keys and values are returned with their escapes decoded.
+    """
+    parser.consume('{"say \\"hi\\"": "line\\nbrea')
+    assert parser.get() == {'say "hi"': "line\nbrea"}
+
+
+@pytest.mark.parametrize("doc, expected", [
+    ('{"a": 18446744073709551617, "b": 1}', {"a": 18446744073709551617, "b": 1}),
+    ('{"a": "\\ud800", "b": 1}', {"a": "\ud800", "b": 1}),
+], ids=["big-int", "lone-surrogate"])
+def test_documents_decode_like_json_loads(streaming_parser, doc, expected):
+    """
+    Documents decode exactly as json.loads does: big integers stay exact, lone surrogates survive.
+    """
+    streaming_parser.consume(doc)
+    assert streaming_parser.get() == expected
+
+
+def test_nan_literal_keeps_every_key(streaming_parser):
+    """
+    NaN is accepted as json.loads accepts it, and the keys around it are kept.
+    """
+    streaming_parser.consume('{"a": NaN, "b": 1}')
+    result = streaming_parser.get()
+    assert result["a"] != result["a"] and result["b"] == 1
+
+
+def test_bson_list_validation_checks_every_item():
+    """
+    A list is only valid when all of its items are, however deeply nested.
+    """
+    assert AsyncDocumentValidator.is_valid_value([1, "a", None, [2.5, {"k": True}]])
+    assert not AsyncDocumentValidator.is_valid_value([1, object()])
+    assert not AsyncDocumentValidator.is_valid_value([[1], [b"raw"]])
+    assert AsyncPairExtractor.extract_complete_pairs({"ok": [1, 2], "bad": [1, {2}]}) == {"ok": [1, 2]}
+
+
+def test_bytes_split_inside_multibyte_characters(parser):
+    """
+    Byte chunks may cut a UTF-8 character; the half character is held back.
+    """
+    data = {"naïve": "☃ snow ☃", "nested": {"k": "ü"}}
+    payload = json.dumps(data, ensure_ascii=False).encode("utf-8")
+    cut = payload.index("☃".encode("utf-8")) + 1
+    parser.consume(payload[:cut])
+    assert parser.get() == {"naïve": ""}
+    parser.consume(payload[cut:])
+    assert parser.get() == data
+
+
+def test_single_byte_chunks_of_multibyte_text(streaming_parser):
+    """
+    Feeding a UTF-8 payload one byte at a time yields the same result as feeding it whole.
+    """
+    data = {"naïve": "☃ snow ☃", "nested": {"k": "ü"}}
+    payload = json.dumps(data, ensure_ascii=False).encode("utf-8")
+    for i in range(len(payload)):
+        streaming_parser.consume(payload[i:i + 1])
+    assert streaming_parser.get() == data
+
+
+def test_repeated_documents_get_fresh_values(streaming_parser):
+    """
+    A document seen before must not hand back values mutated through an earlier result.
+    """
+    doc = '{"seq": 1, "tags": ["a"]}'
+    streaming_parser.consume(doc)
+    streaming_parser.get()["tags"].append("b")
+    streaming_parser.consume(doc)
+    assert streaming_parser.get() == {"seq": 1, "tags": ["a"]}
+
+
+def test_many_documents_in_one_chunk_merge_in_order(streaming_parser):
+    """
+    A chunk holding many complete documents merges them in order; later keys win.
+    """
+    stream = " ".join(json.dumps({"seq": i, f"key{i}": i}) for i in range(20))
+    streaming_parser.consume(stream + ' {"seq": "open", "tail": {"x": 1')
+    expected = {f"key{i}": i for i in range(20)}
+    expected.update({"seq": "open", "tail": {"x": 1}})
+    assert streaming_parser.get() == expected
+
+
+@pytest.mark.parametrize("chunk_size", [3, 64])
+def test_string_free_chunks_close_documents(streaming_parser, chunk_size):
+    """
+    Chunks holding only numbers and braces still open and close documents.
+    """
+    data = [{"v": list(range(40)), "n": {"m": {"k": 1}}}, {"w": [1.5, 2.5]}]
+    stream = "".join(json.dumps(doc) for doc in data)
+    for i in range(0, len(stream), chunk_size):
+        streaming_parser.consume(stream[i:i + chunk_size])
+    assert streaming_parser.get() == {**data[0], **data[1]}
+
+
+def test_pickle_processor_splits_documents_in_order():
+    """
+    Braces inside strings do not split documents, and later documents win on repeated keys.
+    """
+    buffer = '{"a": "}{", "n": 1} {"a": "q\\"}", "b": [1]} {"c": {"d": 2'
+    assert AsyncPickleProcessor._extract_documents_sync(buffer) == [
+        '{"a": "}{", "n": 1}', '{"a": "q\\"}", "b": [1]}', '{"c": {"d": 2',
+    ]
+    assert anyio.run(AsyncPickleProcessor().process_buffer, buffer) == {
+        "a": 'q"}', "n": 1, "b": [1], "c": {"d": 2},
+    }
+
+
+@pytest.mark.parametrize("processor_cls", [AsyncPickleProcessor, AsyncUltraJsonProcessor])
+def test_document_processors_decode_like_json_loads(processor_cls):
+    """
+    The async document processors keep big integers, lone surrogates and NaN as json.loads does.
+    """
+    buffer = '{"a": 18446744073709551617} {"b": "\\ud800"} {"c": NaN, "d": 1}'
+    result = anyio.run(processor_cls().process_buffer, buffer)
+    assert result["a"] == 18446744073709551617 and result["b"] == "\ud800"
+    assert result["c"] != result["c"] and result["d"] == 1